@@ -0,0 +1,14 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from llm_client import LLMClient
+
+
+@pytest.fixture(scope="session")
+def llm_client():
+    """One LLMClient, and its cache connection, for the whole test session."""
+    with LLMClient() as client:
+        yield client
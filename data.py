@@ -4,7 +4,7 @@ Napoleon's Campaign - Game Data Module
 Contains all game data structures, historical events, and initial game state.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 from roguelike_data import TRAITS, RANDOM_EVENTS, GENERALS, ARTIFACTS
 
 
@@ -1176,3 +1176,15 @@ MAP_CONNECTIONS = [
     ("Austria", "Russia"),
     ("Prussia", "Russia"),
 ]
+
+
+def _node_center(name: str) -> Tuple[int, int]:
+    """Return the canvas cell at the center of a territory box."""
+    node = TERRITORY_NODES[name]
+    return node["x"] + node["w"] // 2, node["y"] + node["h"] // 2
+
+
+# Connection lines as (x0, y0, x1, y1) between territory centers
+MAP_EDGE_ENDPOINTS = tuple(
+    (*_node_center(start), *_node_center(end)) for start, end in MAP_CONNECTIONS
+)
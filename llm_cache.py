@@ -2,159 +2,190 @@
 LLM Cache Module
 
 Caches LLM-generated events to reduce API calls and improve performance.
+Entries live in a single SQLite database (WAL mode) inside the cache
+directory, with responses stored as zlib-compressed JSON.
 """
 
 import json
 import hashlib
 import os
+import re
+import sqlite3
+import time
+import zlib
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, Any, Optional
 
 
 class LLMCache:
     """Cache for LLM-generated game content."""
-    
+
+    DB_NAME = "cache.db"
+    # Legacy entries were stored as <md5 hex digest>.json
+    LEGACY_FILE_NAME = re.compile(r"[0-9a-f]{32}\.json")
+
     def __init__(self, cache_dir: str = ".llm_cache"):
         """Initialize the cache.
-        
+
         Args:
-            cache_dir: Directory to store cache files
+            cache_dir: Directory holding the cache database
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
-        
+        self.db_path = self.cache_dir / self.DB_NAME
+
+        # Autocommit mode: every statement is its own transaction. The
+        # connection may be used from executor threads by async callers.
+        self._conn = sqlite3.connect(
+            str(self.db_path), isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, response BLOB NOT NULL, ts INTEGER NOT NULL)"
+        )
+        self._migrate_json_files()
+
     def _get_cache_key(self, prompt: str, model: str) -> str:
         """Generate a cache key from prompt and model.
-        
+
         Args:
             prompt: The prompt text
             model: The model name
-            
+
         Returns:
             MD5 hash of prompt + model
         """
         content = f"{model}:{prompt}"
         return hashlib.md5(content.encode()).hexdigest()
-    
-    def _get_cache_path(self, cache_key: str) -> Path:
-        """Get the file path for a cache key.
-        
-        Args:
-            cache_key: The cache key
-            
-        Returns:
-            Path to cache file
+
+    @staticmethod
+    def _encode(response: Dict[str, Any]) -> bytes:
+        """Serialize a response into a compressed blob."""
+        return zlib.compress(json.dumps(response).encode())
+
+    @staticmethod
+    def _decode(blob: bytes) -> Dict[str, Any]:
+        """Deserialize a compressed blob back into a response."""
+        return json.loads(zlib.decompress(blob))
+
+    def _migrate_json_files(self) -> None:
+        """Import entries left over from the old one-file-per-entry layout.
+
+        Only files named like a cache key that parse as cache entries are
+        imported and removed; anything else in cache_dir is left alone.
         """
-        return self.cache_dir / f"{cache_key}.json"
-    
+        for cache_file in self.cache_dir.glob("*.json"):
+            if not self.LEGACY_FILE_NAME.fullmatch(cache_file.name):
+                continue
+            try:
+                with open(cache_file, 'r') as f:
+                    cache_data = json.load(f)
+                ts = int(datetime.fromisoformat(cache_data['timestamp']).timestamp())
+                response = self._encode(cache_data['response'])
+            except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+                continue  # Not a cache entry we understand
+            self._conn.execute(
+                "INSERT OR IGNORE INTO entries (key, response, ts) VALUES (?, ?, ?)",
+                (cache_file.stem, response, ts)
+            )
+            cache_file.unlink()
+
     def get(self, prompt: str, model: str, max_age_hours: int = 168) -> Optional[Dict[str, Any]]:
         """Get cached response if available and not expired.
-        
+
         Args:
             prompt: The prompt text
             model: The model name
             max_age_hours: Maximum age of cache in hours (default 7 days)
-            
+
         Returns:
             Cached response or None if not found/expired
         """
         cache_key = self._get_cache_key(prompt, model)
-        cache_path = self._get_cache_path(cache_key)
-        
-        if not cache_path.exists():
+        row = self._conn.execute(
+            "SELECT response, ts FROM entries WHERE key = ?", (cache_key,)
+        ).fetchone()
+
+        if row is None:
             return None
-            
+
+        response, ts = row
+
+        # Check if expired
+        if time.time() - ts > max_age_hours * 3600:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (cache_key,))
+            return None
+
         try:
-            with open(cache_path, 'r') as f:
-                cache_data = json.load(f)
-                
-            # Check if expired
-            cached_time = datetime.fromisoformat(cache_data['timestamp'])
-            if datetime.now() - cached_time > timedelta(hours=max_age_hours):
-                cache_path.unlink()  # Delete expired cache
-                return None
-                
-            return cache_data['response']
-            
-        except (json.JSONDecodeError, KeyError, ValueError):
-            # Corrupted cache file
-            cache_path.unlink()
+            return self._decode(response)
+        except (zlib.error, json.JSONDecodeError, ValueError):
+            # Corrupted entry
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (cache_key,))
             return None
-    
+
     def set(self, prompt: str, model: str, response: Dict[str, Any]) -> None:
         """Cache a response.
-        
+
         Args:
             prompt: The prompt text
             model: The model name
             response: The response to cache
         """
         cache_key = self._get_cache_key(prompt, model)
-        cache_path = self._get_cache_path(cache_key)
-        
-        cache_data = {
-            'timestamp': datetime.now().isoformat(),
-            'prompt': prompt[:100],  # Store truncated prompt for debugging
-            'model': model,
-            'response': response
-        }
-        
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f, indent=2)
-    
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries (key, response, ts) VALUES (?, ?, ?)",
+            (cache_key, self._encode(response), int(time.time()))
+        )
+
     def clear_old(self, max_age_hours: int = 168) -> int:
         """Clear cache entries older than max_age_hours.
-        
+
         Args:
             max_age_hours: Maximum age in hours (default 7 days)
-            
+
         Returns:
             Number of entries cleared
         """
-        count = 0
-        cutoff = datetime.now() - timedelta(hours=max_age_hours)
-        
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                with open(cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                    
-                cached_time = datetime.fromisoformat(cache_data['timestamp'])
-                if cached_time < cutoff:
-                    cache_file.unlink()
-                    count += 1
-                    
-            except (json.JSONDecodeError, KeyError, ValueError):
-                # Corrupted file, delete it
-                cache_file.unlink()
-                count += 1
-                
-        return count
-    
+        cutoff = int(time.time()) - max_age_hours * 3600
+        cursor = self._conn.execute("DELETE FROM entries WHERE ts < ?", (cutoff,))
+        return cursor.rowcount
+
     def clear_all(self) -> int:
         """Clear all cache entries.
-        
+
         Returns:
             Number of entries cleared
         """
-        count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
-            count += 1
-        return count
-    
+        cursor = self._conn.execute("DELETE FROM entries")
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
-        
+
         Returns:
             Dictionary with cache stats
         """
-        files = list(self.cache_dir.glob("*.json"))
-        total_size = sum(f.stat().st_size for f in files)
-        
+        total_entries, payload_size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(response)), 0) FROM entries"
+        ).fetchone()
+
+        # One directory scan sizes the database and its WAL/shm side files
+        total_size = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(self.DB_NAME) and entry.is_file():
+                    total_size += entry.stat().st_size
+
         return {
-            'total_entries': len(files),
+            'total_entries': total_entries,
+            'payload_size_bytes': payload_size,
             'total_size_bytes': total_size,
             'total_size_mb': round(total_size / (1024 * 1024), 2),
             'cache_dir': str(self.cache_dir)
@@ -4,10 +4,203 @@ LLM Client for Napoleon's Campaign
 Generates dynamic game text using the opencode CLI.
 """
 
+import asyncio
+import functools
+import re
+import string
 import subprocess
+import tempfile
+import threading
 import json
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, List, Any, Optional
 from llm_cache import LLMCache
+from npc_system import MAX_RECENT_TURNS
+
+# Number of responses kept in memory in front of the on-disk cache
+MEMORY_CACHE_SIZE = 256
+
+# Static instructions go first so every event prompt of a given type shares
+# an identical prefix, which providers can serve from their prompt cache.
+EVENT_PROMPT_PREFIX = """You are narrating Napoleon's Campaign, a historical strategy game.
+
+Return ONLY valid JSON in this exact format (no markdown, no code blocks):
+{
+  "title": "Event Title (10 words max)",
+  "description": "Engaging narrative description (50-100 words)",
+  "choices": [
+    {
+      "text": "Choice 1 description",
+      "consequences": {"troops": 0, "gold": 0, "morale": 0}
+    },
+    {
+      "text": "Choice 2 description",
+      "consequences": {"troops": 0, "gold": 0, "morale": 0}
+    }
+  ]
+}
+
+IMPORTANT RULES:
+- Exactly 2-4 choices
+- Consequences must be balanced (not too extreme)
+- Use Napoleonic-era language and tone
+- Keep descriptions concise but vivid
+- Return ONLY the JSON, nothing else
+
+"""
+
+EVENT_TYPE_GUIDANCE = {
+    "random": """RANDOM EVENTS are non-historical situations that arise from campaign conditions.
+Examples: supply issues, political intrigue, opportunity to recruit a general, discovery of an artifact.
+""",
+    "historical": """HISTORICAL EVENTS are based on real Napoleonic history but adapted to current game state.
+""",
+}
+
+# Seconds allowed for a single opencode call
+OPENCODE_TIMEOUT = 60
+
+# Punctuation is blanked out before descriptions are searched
+_PUNCTUATION_TO_SPACE = str.maketrans({c: " " for c in string.punctuation})
+
+
+def get_context_keywords(player: Dict[str, Any]) -> frozenset:
+    """Collect the stems an event should mention to reflect the player's state.
+    
+    Trait ids pair a distinctive head with a generic role word
+    ("artillery_expert", "charismatic_leader"), so only the head is used.
+    Generals are single names. Artifacts are only recognisable by their
+    full name ("imperial eagle", not "imperial").
+    
+    Args:
+        player: Player state with traits, generals and artifacts
+        
+    Returns:
+        Lowercase stems, matched as word prefixes by validate_event_context
+    """
+    keywords = set()
+    for trait_id in player.get("traits", []):
+        keywords.add(trait_id.lower().split("_")[0])
+    for general_id in player.get("generals", []):
+        keywords.add(general_id.lower().replace("_", " "))
+    for artifact_id in player.get("artifacts", []):
+        keywords.add(artifact_id.lower().replace("_", " "))
+    return frozenset(keywords)
+
+
+def validate_event_context(event: Dict[str, Any], player: Dict[str, Any]) -> bool:
+    """Check whether an event's description references the player's context.
+    
+    A stem matches at the start of a word, so "diplomat" finds
+    "diplomats" and "diplomatic" while "ney" does not find "money". The
+    result is cached on the event under 'references_context'.
+    
+    Args:
+        event: Generated event
+        player: Player state the event was generated for
+        
+    Returns:
+        True if any context stem appears in the description
+    """
+    if "references_context" not in event:
+        words = event.get("description", "").lower().translate(_PUNCTUATION_TO_SPACE).split()
+        text = " " + " ".join(words)
+        event["references_context"] = any(
+            " " + stem in text for stem in get_context_keywords(player)
+        )
+    return event["references_context"]
+
+
+class JSONFieldStream:
+    """Incrementally decode one string field from streamed JSON text.
+    
+    Feed raw chunks as they arrive; each call returns the part of the
+    field's value decoded since the previous call.
+    """
+    
+    _ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+    
+    def __init__(self, field: str):
+        """Initialize the stream.
+        
+        Args:
+            field: Name of the string field to extract
+        """
+        self._pattern = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._buffer = ""
+        self._pos: Optional[int] = None
+        self.done = False
+        
+    def feed(self, chunk: str) -> str:
+        """Add a chunk of raw text and return newly decoded field text."""
+        self._buffer += chunk
+        if self.done:
+            return ""
+        
+        if self._pos is None:
+            match = self._pattern.search(self._buffer)
+            if not match:
+                return ""
+            self._pos = match.end()
+            
+        buf = self._buffer
+        i = self._pos
+        decoded = []
+        while i < len(buf):
+            char = buf[i]
+            if char == '"':
+                self.done = True
+                i += 1
+                break
+            if char == "\\":
+                # Wait for the rest of an escape sequence split across chunks
+                if i + 1 >= len(buf) or (buf[i + 1] == "u" and i + 6 > len(buf)):
+                    break
+                if buf[i + 1] == "u":
+                    end = self._unicode_escape_end(buf, i)
+                    if end is None:
+                        break
+                    try:
+                        decoded.append(json.loads('"%s"' % buf[i:end]))
+                    except ValueError:
+                        pass
+                    i = end
+                else:
+                    decoded.append(self._ESCAPES.get(buf[i + 1], buf[i + 1]))
+                    i += 2
+                continue
+            decoded.append(char)
+            i += 1
+            
+        self._pos = i
+        # Lone surrogates cannot be encoded for output; drop them
+        return "".join(decoded).encode("utf-8", "ignore").decode("utf-8")
+        
+    @staticmethod
+    def _unicode_escape_end(buf: str, i: int) -> Optional[int]:
+        """Return where the \\uXXXX escape at i ends, or None to wait for more.
+        
+        Characters outside the BMP arrive as a high/low surrogate pair of
+        escapes, which must be decoded together.
+        """
+        try:
+            code = int(buf[i + 2:i + 6], 16)
+        except ValueError:
+            return i + 6
+        if not 0xD800 <= code < 0xDC00:
+            return i + 6
+        
+        low = buf[i + 6:i + 12]
+        if len(low) < 6:
+            # Wait only if what follows could still be the low half
+            return None if "\\u".startswith(low[:2]) else i + 6
+        if low.startswith("\\u"):
+            try:
+                if 0xDC00 <= int(low[2:], 16) < 0xE000:
+                    return i + 12
+            except ValueError:
+                pass
+        return i + 6
 
 
 class LLMClient:
@@ -29,36 +222,144 @@ class LLMClient:
             "google/gemini-flash-latest"
         ]
         self.cache = LLMCache()
+        # Hot responses keyed by (model, prompt), most recently used last
+        self._mem_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        # generate_event_async runs calls on executor threads
+        self._mem_lock = threading.Lock()
         
-    def _call_opencode(self, prompt: str, use_cache: bool = True) -> str:
+    def clear_cache(self) -> int:
+        """Clear both the in-memory and on-disk response caches.
+        
+        Returns:
+            Number of on-disk entries cleared
+        """
+        with self._mem_lock:
+            self._mem_cache.clear()
+        return self.cache.clear_all()
+    
+    def close(self) -> None:
+        """Release resources held by the client (the cache connection)."""
+        self.cache.close()
+    
+    def __enter__(self) -> "LLMClient":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def _remember(self, key: tuple, response: str) -> None:
+        """Store a response in the in-memory cache, evicting the oldest."""
+        with self._mem_lock:
+            self._mem_cache[key] = response
+            self._mem_cache.move_to_end(key)
+            if len(self._mem_cache) > MEMORY_CACHE_SIZE:
+                self._mem_cache.popitem(last=False)
+    
+    def _run_streaming(self, prompt: str, model: str,
+                       on_chunk: Callable[[str], None]) -> subprocess.CompletedProcess:
+        """Run opencode and hand each line of output to on_chunk as it arrives.
+        
+        Args:
+            prompt: The prompt to send to the LLM
+            model: Model to use
+            on_chunk: Called with each chunk of stdout
+            
+        Returns:
+            The completed process with the full stdout and stderr
+        """
+        # stderr goes to a file so a chatty stderr cannot block stdout
+        with tempfile.TemporaryFile(mode="w+") as stderr_file:
+            proc = subprocess.Popen(
+                ["opencode", "run", prompt, "--model", model],
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                bufsize=1
+            )
+            timed_out = threading.Event()
+            
+            def kill():
+                timed_out.set()
+                proc.kill()
+            
+            timer = threading.Timer(OPENCODE_TIMEOUT, kill)
+            timer.start()
+            chunks = []
+            try:
+                for line in proc.stdout:
+                    chunks.append(line)
+                    on_chunk(line)
+                proc.wait()
+            except BaseException:
+                # Don't leave opencode running if the callback failed
+                proc.kill()
+                proc.wait()
+                raise
+            finally:
+                timer.cancel()
+                proc.stdout.close()
+                
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(proc.args, OPENCODE_TIMEOUT)
+            
+            stderr_file.seek(0)
+            return subprocess.CompletedProcess(proc.args, proc.returncode,
+                                               "".join(chunks), stderr_file.read())
+    
+    def _call_opencode(self, prompt: str, use_cache: bool = True,
+                       on_chunk: Optional[Callable[[str], None]] = None,
+                       on_retry: Optional[Callable[[], None]] = None) -> str:
         """Call opencode CLI with a prompt.
         
         Args:
             prompt: The prompt to send to the LLM
             use_cache: Whether to use caching (default True)
+            on_chunk: Optional callback receiving output as it streams in;
+                cached responses are delivered in a single chunk
+            on_retry: Optional callback run before each fallback model is
+                tried, so streamed state from a failed attempt can be reset
             
         Returns:
             The LLM's response
         """
-        # Check cache first
+        # Check in-memory cache, then the on-disk cache
         if use_cache:
+            key = (self.model, prompt)
+            with self._mem_lock:
+                response = self._mem_cache.get(key)
+                if response is not None:
+                    self._mem_cache.move_to_end(key)
+            if response is not None:
+                if on_chunk:
+                    on_chunk(response)
+                return response
+            
             cached = self.cache.get(prompt, self.model)
             if cached:
-                return json.dumps(cached)  # Return as JSON string
+                response = json.dumps(cached)  # Return as JSON string
+                self._remember(key, response)
+                if on_chunk:
+                    on_chunk(response)
+                return response
         
         # Try primary model
         models_to_try = [self.model] + self.fallback_models
         last_error = None
         
-        for model in models_to_try:
+        for attempt, model in enumerate(models_to_try):
+            if attempt and on_retry:
+                on_retry()
             try:
                 # Use opencode run for non-interactive mode
-                result = subprocess.run(
-                    ["opencode", "run", prompt, "--model", model],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
+                if on_chunk:
+                    result = self._run_streaming(prompt, model, on_chunk)
+                else:
+                    result = subprocess.run(
+                        ["opencode", "run", prompt, "--model", model],
+                        capture_output=True,
+                        text=True,
+                        timeout=OPENCODE_TIMEOUT
+                    )
                 
                 if result.returncode != 0:
                     last_error = f"Model {model} error: {result.stderr}"
@@ -71,7 +372,11 @@ class LLMClient:
                     try:
                         # Try to parse as JSON to validate before caching
                         parsed = json.loads(response) if response.startswith('{') else response
-                        self.cache.set(prompt, model, parsed if isinstance(parsed, dict) else {"text": response})
+                        cached = parsed if isinstance(parsed, dict) else {"text": response}
+                        self.cache.set(prompt, model, cached)
+                        if model == self.model:
+                            # Mirror what a disk hit would return
+                            self._remember((model, prompt), json.dumps(cached))
                     except json.JSONDecodeError:
                         pass  # Don't cache malformed responses
                 
@@ -86,12 +391,16 @@ class LLMClient:
         # All models failed
         raise Exception(f"All models failed. Last error: {last_error}")
     
-    def generate_event(self, game_state: Dict[str, Any], event_trigger: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_event(self, game_state: Dict[str, Any], event_trigger: Dict[str, Any],
+                       on_chunk: Optional[Callable[[str], None]] = None,
+                       on_retry: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
         """Generate a dynamic event based on game state.
         
         Args:
             game_state: Current game state
             event_trigger: Metadata about the event (year, type, historical context)
+            on_chunk: Optional callback receiving raw output as it streams in
+            on_retry: Optional callback run before a fallback model is tried
             
         Returns:
             Generated event with title, description, and choices
@@ -99,9 +408,7 @@ class LLMClient:
         player = game_state["player"]
         
         # Build context
-        context = f"""You are narrating Napoleon's Campaign, a historical strategy game.
-
-CURRENT GAME STATE:
+        context = f"""CURRENT GAME STATE:
 - Year: {game_state['year']}
 - Season: {game_state['season']}
 - Troops: {player['troops']:,}
@@ -129,40 +436,18 @@ CURRENT GAME STATE:
             
         # Event type specific prompts
         if event_trigger.get('type') == 'random':
-            event_prompt = f"""Generate a RANDOM EVENT for Napoleon during {game_state['year']}.
-This should be a non-historical situation that arises from campaign conditions.
-Examples: supply issues, political intrigue, opportunity to recruit a general, discovery of an artifact."""
+            guidance = EVENT_TYPE_GUIDANCE["random"]
+            event_prompt = f"Generate a RANDOM EVENT for Napoleon during {game_state['year']}."
         else:
+            guidance = EVENT_TYPE_GUIDANCE["historical"]
             event_prompt = f"""Generate a HISTORICAL EVENT for the year {game_state['year']}.
-Historical Context: {event_trigger.get('historical_context', 'Major military campaign')}
-The event should be based on real Napoleonic history but adapted to current game state."""
+Historical Context: {event_trigger.get('historical_context', 'Major military campaign')}"""
         
-        prompt = context + "\n" + event_prompt + """
-
-Return ONLY valid JSON in this exact format (no markdown, no code blocks):
-{
-  "title": "Event Title (10 words max)",
-  "description": "Engaging narrative description (50-100 words)",
-  "choices": [
-    {
-      "text": "Choice 1 description",
-      "consequences": {"troops": 0, "gold": 0, "morale": 0}
-    },
-    {
-      "text": "Choice 2 description",
-      "consequences": {"troops": 0, "gold": 0, "morale": 0}
-    }
-  ]
-}
-
-IMPORTANT RULES:
-- Exactly 2-4 choices
-- Consequences must be balanced (not too extreme)
-- Use Napoleonic-era language and tone
-- Keep descriptions concise but vivid
-- Return ONLY the JSON, nothing else"""
+        # Stable prefix first, per-turn state last
+        prompt = (EVENT_PROMPT_PREFIX + guidance + "\n" + context + "\n" + event_prompt
+                  + "\n\nReturn ONLY the JSON, nothing else.")
         
-        response = self._call_opencode(prompt)
+        response = self._call_opencode(prompt, on_chunk=on_chunk, on_retry=on_retry)
         
         # Try to extract JSON from response
         try:
@@ -196,14 +481,39 @@ IMPORTANT RULES:
                 ]
             }
     
+    async def generate_event_async(self, game_state: Dict[str, Any],
+                                   event_trigger: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of generate_event.
+        
+        The opencode call blocks, so it runs in the default executor; this
+        lets several events be generated concurrently.
+        
+        Args:
+            game_state: Current game state
+            event_trigger: Metadata about the event (year, type, historical context)
+            
+        Returns:
+            Generated event with title, description, and choices
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.generate_event, game_state, event_trigger)
+        )
+    
     def generate_npc_dialogue(self, npc: Any, game_state: Dict[str, Any], 
-                             player_input: str) -> Dict[str, Any]:
+                             player_input: str,
+                             on_chunk: Optional[Callable[[str], None]] = None,
+                             on_retry: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
         """Generate NPC dialogue response.
         
         Args:
             npc: NPC instance with personality and history
             game_state: Current game state
             player_input: What the player said/asked
+            on_chunk: Optional callback receiving raw output as it streams in;
+                wrap it with JSONFieldStream("response") to get the reply text
+            on_retry: Optional callback run before a fallback model is tried;
+                use it to start a fresh JSONFieldStream
             
         Returns:
             Dict with 'response' and 'relationship_change'
@@ -215,7 +525,16 @@ IMPORTANT RULES:
 
 YOUR ROLE: {npc.role}
 YOUR PERSONALITY: {npc.personality}
-
+"""
+        
+        # Summarized history changes rarely, so it sits ahead of the per-turn state
+        summarized = npc.get_summarized_history()
+        if summarized:
+            context += "\nEARLIER CONVERSATIONS (summarized):\n"
+            for conv in summarized:
+                context += f"Napoleon: {conv['player']} / You: {conv['npc']}\n"
+        
+        context += f"""
 CURRENT RELATIONSHIP WITH NAPOLEON: {npc.relationship}/100
 ({"Very loyal" if npc.relationship > 70 else "Loyal" if npc.relationship > 50 else "Neutral" if npc.relationship > 30 else "Distrustful"})
 
@@ -231,7 +550,7 @@ GAME STATE:
 """
         
         # Add recent conversation history
-        recent = npc.get_recent_history(3)
+        recent = npc.get_recent_history(MAX_RECENT_TURNS)
         if recent:
             context += "\nRECENT CONVERSATION HISTORY:\n"
             for conv in recent:
@@ -260,7 +579,8 @@ relationship_change should be -5 to +5 based on:
 
 Return ONLY the JSON, nothing else."""
         
-        response = self._call_opencode(prompt, use_cache=False)  # Don't cache dialogue
+        response = self._call_opencode(prompt, use_cache=False, on_chunk=on_chunk,
+                                       on_retry=on_retry)  # Don't cache dialogue
         
         try:
             # Remove markdown if present
@@ -21,12 +21,18 @@ from ui import (
     show_error_message,
     show_success_message,
     show_map,
+    show_resource_change,
+    show_status_fast,
+    turn_frame,
 )
 from data import get_initial_game_state
 from utils import save_game, load_game
 from npc_dialogue import handle_npc_dialogue
 from goal_manager import handle_goals
 
+# Resources whose per-turn change is shown after a choice
+RESOURCES = ("troops", "gold", "morale")
+
 # Initialize Typer app
 app = typer.Typer(help="Napoleon's Campaign - A Historical Strategy Game")
 
@@ -34,18 +40,23 @@ app = typer.Typer(help="Napoleon's Campaign - A Historical Strategy Game")
 def run_game_loop(game_state):
     """Main game loop handling turns and events."""
     while not game_state["game_over"]:
-        clear_screen()
+        current_event = game_state["current_event"]
+
+        # Draw the whole turn screen with a single terminal write
+        with turn_frame():
+            clear_screen()
 
-        # Show current game status
-        show_status(game_state)
+            # Show current game status
+            show_status(game_state)
+
+            if current_event:
+                show_event(current_event)
 
         # Process current event
-        current_event = game_state["current_event"]
         if current_event:
-            show_event(current_event)
-
             # Get player choice
             choice = get_player_choice(current_event, game_state)
+            before = {resource: game_state["player"][resource] for resource in RESOURCES}
 
             # Process the choice and update game state
             game_state = process_turn(game_state, choice)
@@ -53,6 +64,17 @@ def run_game_loop(game_state):
             # Check for game over conditions
             game_state = check_game_over(game_state)
 
+            # Show what the turn changed and redraw the status line in place
+            # of a full-screen redraw
+            player = game_state["player"]
+            changes = {
+                resource: player[resource] - before[resource]
+                for resource in RESOURCES
+                if player[resource] != before[resource]
+            }
+            show_resource_change(changes)
+            show_status_fast(game_state)
+
         # If no current event, advance to next one
         else:
             game_state = process_turn(game_state, None)
@@ -3,13 +3,13 @@ NPC Dialogue Handler for main.py
 """
 
 from npc_system import create_npc_instance, get_available_npcs, get_npc
-from ui import show_available_npcs, show_npc_dialogue
+from ui import console, show_available_npcs, show_npc_dialogue
 from rich.prompt import Prompt
 
 
 def handle_npc_dialogue(game_state):
     """Handle NPC dialogue interaction."""
-    from llm_client import LLMClient
+    from llm_client import LLMClient, JSONFieldStream
     
     # Initialize NPCs if needed
     if 'npcs' not in game_state:
@@ -53,8 +53,26 @@ def handle_npc_dialogue(game_state):
             llm_client = LLMClient()
             game_state['llm_client'] = llm_client
         
-        print("\n[dim]Thinking...[/dim]")
-        dialogue_data = llm_client.generate_npc_dialogue(npc, game_state, player_input)
+        console.print("\n[dim]Thinking...[/dim]")
+        
+        # Preview the reply as it streams in; the full panel follows
+        stream = JSONFieldStream("response")
+        
+        def show_partial(chunk):
+            text = stream.feed(chunk)
+            if text:
+                console.print(text, end="", style="dim", markup=False, highlight=False)
+        
+        def restart_preview():
+            # A fallback model starts its reply from scratch
+            nonlocal stream
+            stream = JSONFieldStream("response")
+            console.print()
+        
+        dialogue_data = llm_client.generate_npc_dialogue(npc, game_state, player_input,
+                                                         on_chunk=show_partial,
+                                                         on_retry=restart_preview)
+        console.print()
         
         # Update relationship
         relationship_change = dialogue_data.get('relationship_change', 0)
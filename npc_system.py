@@ -4,10 +4,65 @@ NPC System for Napoleon's Campaign
 Manages persistent NPCs with personality, memory, and dialogue.
 """
 
+import re
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 
+# Conversations kept verbatim; older ones are compressed
+MAX_RECENT_TURNS = 5
+# Compressed conversations kept beyond the verbatim window
+MAX_SUMMARIZED_TURNS = 20
+# Sentences kept per side of a compressed conversation
+MAX_SUMMARY_SENTENCES = 2
+
+# Interjections dropped when they make up a whole clause ("Well, ...",
+# "..., Sire."); inside a clause they may carry meaning and are kept
+_FILLER_CLAUSES = frozenset({
+    "well", "indeed", "truly", "of course", "certainly", "perhaps", "really",
+    "quite", "i think", "i believe", "you know", "mon empereur", "sire",
+})
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_CLAUSE_SPLIT = re.compile(r"\s*,\s*")
+_TRAILING_PUNCTUATION = re.compile(r"[.!?]+$")
+
+
+def _strip_filler(sentence: str) -> str:
+    """Drop filler clauses from a sentence; returns "" if nothing else is left."""
+    match = _TRAILING_PUNCTUATION.search(sentence)
+    end = match.group() if match else ""
+    body = sentence[:len(sentence) - len(end)]
+    
+    clauses = [c for c in _CLAUSE_SPLIT.split(body) if c and c.lower() not in _FILLER_CLAUSES]
+    if not clauses:
+        return ""
+    
+    stripped = ", ".join(clauses)
+    if body[:1].isupper():
+        stripped = stripped[0].upper() + stripped[1:]
+    return stripped + end
+
+
+def compress_text(text: str) -> str:
+    """Extractively compress a conversation line.
+    
+    Drops filler clauses, then keeps the first sentences, leaving the
+    names and decisions that matter as context.
+    
+    Args:
+        text: Original line
+        
+    Returns:
+        Compressed line
+    """
+    sentences = [s for s in _SENTENCE_END.split(text.strip()) if s]
+    kept = [s for s in (_strip_filler(s) for s in sentences) if s]
+    if not kept:
+        # Nothing but filler; keep the opening rather than an empty line
+        kept = sentences
+    return " ".join(kept[:MAX_SUMMARY_SENTENCES])
+
+
 class NPC:
     """Represents a persistent NPC with personality and memory."""
     
@@ -47,6 +102,28 @@ class NPC:
         })
         
         self.relationship = max(0, min(100, self.relationship + relationship_change))
+        self._compact_history()
+        
+    def _compact_history(self):
+        """Compress conversations outside the recent window and drop the oldest."""
+        older = self.conversation_history[:-MAX_RECENT_TURNS]
+        for conv in older:
+            if not conv.get('compressed'):
+                conv['player'] = compress_text(conv['player'])
+                conv['npc'] = compress_text(conv['npc'])
+                conv['compressed'] = True
+        
+        overflow = len(older) - MAX_SUMMARIZED_TURNS
+        if overflow > 0:
+            del self.conversation_history[:overflow]
+        
+    def get_summarized_history(self) -> List[Dict[str, Any]]:
+        """Get compressed conversations older than the recent window.
+        
+        Returns:
+            List of compressed conversations, oldest first
+        """
+        return [conv for conv in self.conversation_history if conv.get('compressed')]
         
     def get_recent_history(self, count: int = 3) -> List[Dict[str, Any]]:
         """Get recent conversation history.
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test the event context check (offline, no opencode needed)
+"""
+
+import pytest
+
+from llm_client import get_context_keywords, validate_event_context
+
+PLAYER = {
+    "traits": ["artillery_expert", "diplomat"],
+    "generals": ["ney"],
+    "artifacts": ["imperial_eagle", "code_civil"],
+}
+
+
+def test_keywords_use_distinctive_stems():
+    assert get_context_keywords(PLAYER) == {
+        "artillery", "diplomat", "ney", "imperial eagle", "code civil",
+    }
+
+
+@pytest.mark.parametrize("description", [
+    "Austrian diplomats arrive with a diplomatic offer.",
+    "Your artillery batteries open fire at dawn.",
+    "Marshal Ney leads the charge!",
+    "The Imperial Eagle is raised over the bridge.",
+    "Jurists debate the Code Civil in Milan.",
+])
+def test_references_are_found(description):
+    assert validate_event_context({"description": description}, PLAYER)
+
+
+@pytest.mark.parametrize("description", [
+    "An expert cartographer offers imperial maps.",
+    "The treasury is short of money for the journey.",
+    "A secret code is intercepted at the border.",
+    "",
+])
+def test_unrelated_descriptions_do_not_match(description):
+    assert not validate_event_context({"description": description}, PLAYER)
+
+
+def test_player_without_context_never_matches():
+    assert not validate_event_context({"description": "Ney and the diplomats."}, {})
+
+
+def test_result_is_cached_on_event():
+    event = {"description": "Marshal Ney arrives."}
+    assert validate_event_context(event, PLAYER)
+    assert event["references_context"] is True
+    event["description"] = "Nothing relevant."
+    assert validate_event_context(event, PLAYER)
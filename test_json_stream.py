@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test incremental JSON field decoding (offline, no opencode needed)
+"""
+
+import json
+
+from llm_client import JSONFieldStream
+
+
+def feed_in_chunks(text, size, field="response"):
+    """Feed text to a fresh stream in fixed-size chunks and join the output."""
+    stream = JSONFieldStream(field)
+    decoded = "".join(stream.feed(text[i:i + size]) for i in range(0, len(text), size))
+    return decoded, stream
+
+
+def test_plain_field():
+    decoded, stream = feed_in_chunks('{"response": "Vive l\'Empereur!", "x": 1}', 1000)
+    assert decoded == "Vive l'Empereur!"
+    assert stream.done
+
+
+def test_quote_and_backslash_escapes():
+    value = 'He said "march" \\ then left\nat dawn\t!'
+    decoded, _ = feed_in_chunks(json.dumps({"response": value}), 1000)
+    assert decoded == value
+
+
+def test_unicode_escapes():
+    value = "Café à Moscou"
+    decoded, _ = feed_in_chunks(json.dumps({"response": value}), 1000)
+    assert decoded == value
+
+
+def test_surrogate_pair_escape():
+    value = "Victory 😀 at Austerlitz"
+    raw = json.dumps({"response": value})
+    assert "\\ud83d\\ude00" in raw
+    decoded, _ = feed_in_chunks(raw, 1000)
+    assert decoded == value
+
+
+def test_chunks_split_inside_escapes():
+    value = 'a "b" \\ c\nd é 😀 e'
+    raw = json.dumps({"before": 1, "response": value, "after": 2})
+    for size in range(1, 14):
+        decoded, stream = feed_in_chunks(raw, size)
+        assert decoded == value, size
+        assert stream.done
+
+
+def test_lone_surrogate_is_dropped():
+    decoded, _ = feed_in_chunks('{"response": "a\\ud83d b"}', 1000)
+    assert decoded == "a b"
+    decoded.encode("utf-8")
+
+
+def test_missing_field():
+    decoded, stream = feed_in_chunks('{"reply": "hello", "relationship_change": 2}', 3)
+    assert decoded == ""
+    assert not stream.done
+
+
+def test_nothing_after_closing_quote():
+    stream = JSONFieldStream("response")
+    assert stream.feed('{"response": "done"') == "done"
+    assert stream.feed(', "response": "again"}') == ""
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test the SQLite-backed LLM cache (offline)
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from llm_cache import LLMCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMCache(str(tmp_path / "cache"))
+    yield cache
+    cache.close()
+
+
+def write_legacy_entry(cache_dir, prompt, model, response, age_hours=0):
+    """Write a cache file in the old one-JSON-file-per-entry layout."""
+    key = hashlib.md5(f"{model}:{prompt}".encode()).hexdigest()
+    cache_data = {
+        "timestamp": (datetime.now() - timedelta(hours=age_hours)).isoformat(),
+        "prompt": prompt[:100],
+        "model": model,
+        "response": response,
+    }
+    path = cache_dir / f"{key}.json"
+    path.write_text(json.dumps(cache_data, indent=2))
+    return path
+
+
+def age_all_entries(cache, hours):
+    """Backdate every entry by the given number of hours."""
+    cache._conn.execute("UPDATE entries SET ts = ts - ?", (hours * 3600,))
+
+
+def test_set_and_get(cache):
+    cache.set("prompt", "model", {"title": "Austerlitz"})
+    assert cache.get("prompt", "model") == {"title": "Austerlitz"}
+    assert cache.get("prompt", "other-model") is None
+    assert cache.get("other prompt", "model") is None
+
+
+def test_legacy_json_files_are_migrated_and_removed(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    fresh = write_legacy_entry(cache_dir, "fresh", "model", {"text": "new"})
+    stale = write_legacy_entry(cache_dir, "stale", "model", {"text": "old"}, age_hours=200)
+
+    cache = LLMCache(str(cache_dir))
+    try:
+        assert not fresh.exists()
+        assert not stale.exists()
+        assert cache.get("fresh", "model") == {"text": "new"}
+        # Migrated entries keep their original timestamps
+        assert cache.get("stale", "model") is None
+        assert cache.get_stats()["total_entries"] == 1
+    finally:
+        cache.close()
+
+
+def test_migration_leaves_other_files_alone(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    corrupt = cache_dir / f"{'0' * 32}.json"
+    corrupt.write_text("{not json")
+    not_an_entry = cache_dir / f"{'a' * 32}.json"
+    not_an_entry.write_text(json.dumps({"year": 1805}))
+    save = cache_dir / "napoleon_save.json"
+    save.write_text(json.dumps({"timestamp": "2024-01-01T00:00:00", "response": {}}))
+
+    cache = LLMCache(str(cache_dir))
+    try:
+        assert corrupt.read_text() == "{not json"
+        assert not_an_entry.exists()
+        assert save.exists()
+        assert cache.get_stats()["total_entries"] == 0
+    finally:
+        cache.close()
+
+
+def test_entries_expire_after_max_age(cache):
+    cache.set("prompt", "model", {"text": "hi"})
+    age_all_entries(cache, 2)
+    assert cache.get("prompt", "model", max_age_hours=3) == {"text": "hi"}
+    assert cache.get("prompt", "model", max_age_hours=1) is None
+    # Expired entries are deleted on lookup
+    assert cache.get("prompt", "model", max_age_hours=3) is None
+
+
+def test_clear_old_and_clear_all_counts(cache):
+    cache.set("old 1", "model", {"n": 1})
+    cache.set("old 2", "model", {"n": 2})
+    age_all_entries(cache, 10)
+    cache.set("new", "model", {"n": 3})
+
+    assert cache.clear_old(max_age_hours=5) == 2
+    assert cache.get("new", "model") == {"n": 3}
+    assert cache.clear_all() == 1
+    assert cache.clear_all() == 0
+
+
+def test_get_stats(cache):
+    cache.set("prompt", "model", {"text": "x" * 100})
+    stats = cache.get_stats()
+    assert set(stats) == {
+        "total_entries",
+        "payload_size_bytes",
+        "total_size_bytes",
+        "total_size_mb",
+        "cache_dir",
+    }
+    assert stats["total_entries"] == 1
+    assert 0 < stats["payload_size_bytes"] <= stats["total_size_bytes"]
+    assert stats["cache_dir"] == str(cache.cache_dir)
+
+
+def test_entries_persist_across_instances(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    first = LLMCache(cache_dir)
+    first.set("prompt", "model", {"text": "kept"})
+    first.close()
+
+    second = LLMCache(cache_dir)
+    try:
+        assert second.get("prompt", "model") == {"text": "kept"}
+    finally:
+        second.close()
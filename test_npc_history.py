@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test NPC conversation compression and history windows (offline)
+"""
+
+import pytest
+
+import npc_system
+from npc_system import NPC, MAX_RECENT_TURNS, MAX_SUMMARIZED_TURNS, compress_text
+
+
+@pytest.mark.parametrize("text", [
+    "Our troops are well-supplied and ready.",
+    "This is a just cause.",
+    "Paris, Lyon, and Marseille are loyal.",
+    "Very well.",
+])
+def test_content_is_kept_intact(text):
+    assert compress_text(text) == text
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("This is a just cause, Sire.", "This is a just cause."),
+    ("Sire, we must march on Vienna.", "We must march on Vienna."),
+    ("Indeed, the Austrians are weak!", "The Austrians are weak!"),
+    ("We march, of course, at dawn.", "We march, at dawn."),
+])
+def test_filler_clauses_are_dropped(text, expected):
+    assert compress_text(text) == expected
+
+
+def test_only_leading_sentences_are_kept():
+    text = "Sire, we march on Vienna. Indeed. The Austrians are weak. Ney leads the van."
+    assert compress_text(text) == "We march on Vienna. The Austrians are weak."
+
+
+def test_all_filler_falls_back_to_original():
+    assert compress_text("Well, perhaps. Indeed!") == "Well, perhaps. Indeed!"
+
+
+def test_no_empty_punctuation_left_behind():
+    for text in ["Well, perhaps. Indeed!", "Yes, Sire.", "Sire! We ride, mon empereur."]:
+        result = compress_text(text)
+        assert not result.startswith((",", ".", "!", " "))
+        assert ", ." not in result and " ." not in result
+
+
+def make_npc():
+    return NPC("ney", "Michel Ney", "Marshal", "Brave and impulsive")
+
+
+def talk(npc, count, start=0):
+    for i in range(start, start + count):
+        npc.add_conversation(f"Sire, order {i}. Second. Third.", f"Indeed, reply {i}. More. Even more.")
+
+
+def test_recent_turns_stay_verbatim():
+    npc = make_npc()
+    talk(npc, MAX_RECENT_TURNS)
+    assert not npc.get_summarized_history()
+    assert npc.conversation_history[0]["player"] == "Sire, order 0. Second. Third."
+
+
+def test_older_turns_are_compressed():
+    npc = make_npc()
+    talk(npc, MAX_RECENT_TURNS + 3)
+    summarized = npc.get_summarized_history()
+    assert len(summarized) == 3
+    assert summarized[0]["player"] == "Order 0. Second."
+    assert summarized[0]["npc"] == "Reply 0. More."
+    recent = npc.conversation_history[-MAX_RECENT_TURNS:]
+    assert not any(conv.get("compressed") for conv in recent)
+
+
+def test_nothing_is_compressed_twice(monkeypatch):
+    calls = []
+    real = npc_system.compress_text
+
+    def counting(text):
+        calls.append(text)
+        return real(text)
+
+    monkeypatch.setattr(npc_system, "compress_text", counting)
+    npc = make_npc()
+    talk(npc, MAX_RECENT_TURNS + 10)
+    # Each turn that left the verbatim window was compressed once per side
+    assert len(calls) == 2 * 10
+
+
+def test_overflow_drops_oldest():
+    npc = make_npc()
+    extra = 4
+    talk(npc, MAX_RECENT_TURNS + MAX_SUMMARIZED_TURNS + extra)
+    history = npc.conversation_history
+    assert len(history) == MAX_RECENT_TURNS + MAX_SUMMARIZED_TURNS
+    assert len(npc.get_summarized_history()) == MAX_SUMMARIZED_TURNS
+    assert history[0]["player"] == f"Order {extra}. Second."
+    last = MAX_RECENT_TURNS + MAX_SUMMARIZED_TURNS + extra - 1
+    assert history[-1]["player"] == f"Sire, order {last}. Second. Third."
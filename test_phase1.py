@@ -1,87 +1,62 @@
 #!/usr/bin/env python3
 """
 Comprehensive verification test for Phase 1 enhancements
-Tests: Caching, Fallback, Event Generation
+Tests: Caching, Fallback, Event Generation, Concurrent Generation
+
+Run with: pytest test_phase1.py -n auto
 """
 
+import asyncio
+import shutil
 import time
-from llm_client import LLMClient
-from llm_cache import LLMCache
+import warnings
+
+import pytest
+
+from llm_client import LLMClient, validate_event_context
 from data import get_initial_game_state
 
-def test_caching():
+pytestmark = pytest.mark.skipif(
+    shutil.which("opencode") is None, reason="opencode CLI not installed"
+)
+
+
+def test_caching(llm_client):
     """Test that caching works correctly."""
-    print("=" * 60)
-    print("TEST 1: Caching System")
-    print("=" * 60)
-    
-    client = LLMClient()
-    cache = client.cache
-    
-    # Clear cache first
-    cleared = cache.clear_all()
-    print(f"✓ Cleared {cleared} old cache entries\n")
+    llm_client.clear_cache()
     
     game_state = get_initial_game_state()
     event_trigger = {"id": "cache_test", "type": "random", "year": 1796}
     
     # First call - should hit API
-    print("📡 First call (should hit API)...")
     start = time.time()
-    event1 = client.generate_event(game_state, event_trigger)
+    event1 = llm_client.generate_event(game_state, event_trigger)
     time1 = time.time() - start
-    print(f"   ✓ Generated in {time1:.2f}s")
-    print(f"   Title: {event1['title']}\n")
     
     # Second call - should use cache
-    print("⚡ Second call (should use cache)...")
     start = time.time()
-    event2 = client.generate_event(game_state, event_trigger)
+    event2 = llm_client.generate_event(game_state, event_trigger)
     time2 = time.time() - start
-    print(f"   ✓ Generated in {time2:.2f}s")
-    print(f"   Title: {event2['title']}\n")
     
-    # Verify cache was used
-    if time2 < time1 / 10:  # Cache should be >10x faster
-        print(f"✅ CACHE WORKING: {time2:.3f}s vs {time1:.2f}s ({time1/time2:.0f}x faster)\n")
-    else:
-        print(f"⚠️  Cache may not be working: {time2:.2f}s vs {time1:.2f}s\n")
-    
-    # Show cache stats
-    stats = cache.get_stats()
-    print(f"Cache Stats: {stats['total_entries']} entries, {stats['total_size_mb']}MB\n")
-    
-    return time2 < 0.5  # Cache should be instant
+    assert event2["title"] == event1["title"]
+    assert time2 < 0.5, f"Cache may not be working: {time2:.2f}s vs {time1:.2f}s"
+    assert llm_client.cache.get_stats()["total_entries"] >= 1
+
 
 def test_fallback():
     """Test fallback model support."""
-    print("=" * 60)
-    print("TEST 2: Fallback System")
-    print("=" * 60)
-    
     # Create client with a fake primary model to force fallback
-    client = LLMClient(model="google/nonexistent-model")
-    
-    game_state = get_initial_game_state()
-    event_trigger = {"id": "fallback_test", "type": "random", "year": 1796}
-    
-    print("🔄 Testing with fake primary model (should fallback)...")
-    try:
+    with LLMClient(model="google/nonexistent-model") as client:
+        game_state = get_initial_game_state()
+        event_trigger = {"id": "fallback_test", "type": "random", "year": 1796}
+        
         event = client.generate_event(game_state, event_trigger)
-        print(f"   ✓ Fallback successful!")
-        print(f"   Title: {event['title']}\n")
-        return True
-    except Exception as e:
-        print(f"   ❌ Fallback failed: {e}\n")
-        return False
+        
+        assert event["title"]
+
 
-def test_context_awareness():
+def test_context_awareness(llm_client):
     """Test that events are context-aware."""
-    print("=" * 60)
-    print("TEST 3: Context-Aware Event Generation")
-    print("=" * 60)
-    
-    client = LLMClient()
     game_state = get_initial_game_state()
     
     # Add some traits/generals to test context
@@ -90,66 +65,31 @@ def test_context_awareness():
     
     event_trigger = {"id": "context_test", "type": "random", "year": 1796}
     
-    print("🎯 Generating event with traits and generals...")
-    event = client.generate_event(game_state, event_trigger)
+    event = llm_client.generate_event(game_state, event_trigger)
     
-    print(f"Title: {event['title']}")
-    print(f"Description: {event['description'][:100]}...")
-    print(f"Choices: {len(event['choices'])}\n")
+    assert event["title"]
+    assert event["choices"]
     
-    # Check if description or choices reference the context
-    desc_lower = event['description'].lower()
-    has_context = any([
-        'artillery' in desc_lower,
-        'ney' in desc_lower,
-        'diplomat' in desc_lower
-    ])
-    
-    if has_context:
-        print("✅ Event references player context!\n")
-    else:
-        print("⚠️  Event may not be using context\n")
-    
-    return True
+    # Check if description references the context
+    if not validate_event_context(event, game_state['player']):
+        warnings.warn("Event may not be using context")
 
-def main():
-    print("\n🧪 PHASE 1 VERIFICATION TEST\n")
-    
-    results = []
-    
-    # Test 1: Caching
-    try:
-        results.append(("Caching", test_caching()))
-    except Exception as e:
-        print(f"❌ Caching test failed: {e}\n")
-        results.append(("Caching", False))
-    
-    # Test 2: Fallback
-    try:
-        results.append(("Fallback", test_fallback()))
-    except Exception as e:
-        print(f"❌ Fallback test failed: {e}\n")
-        results.append(("Fallback", False))
-    
-    # Test 3: Context
-    try:
-        results.append(("Context-Aware", test_context_awareness()))
-    except Exception as e:
-        print(f"❌ Context test failed: {e}\n")
-        results.append(("Context-Aware", False))
+
+def test_concurrent_generation(llm_client):
+    """Test that several events can be generated at once off the event loop."""
+    game_state = get_initial_game_state()
+    triggers = [
+        {"id": "concurrent_random", "type": "random", "year": 1796},
+        {"id": "concurrent_historical", "type": "historical", "year": 1797},
+        {"id": "concurrent_random_late", "type": "random", "year": 1798},
+    ]
     
-    # Summary
-    print("=" * 60)
-    print("SUMMARY")
-    print("=" * 60)
-    for name, passed in results:
-        status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{status}: {name}")
+    async def generate_all():
+        return await asyncio.gather(
+            *(llm_client.generate_event_async(game_state, trigger) for trigger in triggers)
+        )
     
-    all_passed = all(r[1] for r in results)
-    print(f"\nOverall: {'✅ ALL TESTS PASSED' if all_passed else '⚠️  SOME TESTS FAILED'}\n")
+    events = asyncio.run(generate_all())
     
-    return 0 if all_passed else 1
-
-if __name__ == "__main__":
-    exit(main())
+    assert len(events) == len(triggers)
+    assert all(event["title"] and event["choices"] for event in events)
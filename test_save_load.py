@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test save/load round trips for every save format (offline)
+"""
+
+import json
+import os
+
+import pytest
+
+import utils
+from data import get_initial_game_state
+
+needs_zstd = pytest.mark.skipif(utils.zstandard is None, reason="zstandard not installed")
+needs_msgpack = pytest.mark.skipif(utils.msgpack is None, reason="msgpack not installed")
+
+
+@pytest.fixture
+def game_state():
+    """A fresh initial state, normalized to what JSON gives back."""
+    return json.loads(json.dumps(get_initial_game_state()))
+
+
+def test_default_round_trip(tmp_path, game_state):
+    path = str(tmp_path / "save.json")
+    assert utils.save_game(game_state, path)
+    assert utils.load_game(path) == game_state
+    assert not os.path.exists(path + ".tmp")
+
+
+@needs_zstd
+def test_default_save_is_zstd_compressed(tmp_path, game_state):
+    path = str(tmp_path / "save.json")
+    utils.save_game(game_state, path)
+    with open(path, "rb") as f:
+        assert f.read(4) == utils.ZSTD_MAGIC
+
+
+def test_pretty_save_is_plain_indented_json(tmp_path, game_state):
+    path = str(tmp_path / "save.json")
+    assert utils.save_game(game_state, path, pretty=True)
+    with open(path, "rb") as f:
+        raw = f.read()
+    assert raw.startswith(b"{\n  ")
+    assert json.loads(raw) == game_state
+    assert utils.load_game(path) == game_state
+
+
+def test_legacy_plain_json_save_loads(tmp_path, game_state):
+    path = tmp_path / "save.json"
+    path.write_text(json.dumps(game_state, indent=2))
+    assert utils.load_game(str(path)) == game_state
+
+
+@pytest.mark.parametrize("stub", [("orjson",), ("zstandard",), ("orjson", "zstandard")])
+def test_round_trip_without_optional_codecs(tmp_path, monkeypatch, game_state, stub):
+    for name in stub:
+        monkeypatch.setattr(utils, name, None)
+    path = str(tmp_path / "save.json")
+    assert utils.save_game(game_state, path)
+    assert utils.load_game(path) == game_state
+
+
+@needs_zstd
+def test_compressed_save_without_zstandard_fails_cleanly(tmp_path, monkeypatch, game_state, capsys):
+    path = str(tmp_path / "save.json")
+    utils.save_game(game_state, path)
+    monkeypatch.setattr(utils, "zstandard", None)
+    assert utils.load_game(path) is None
+    assert "zstandard is not installed" in capsys.readouterr().out
+
+
+def test_missing_save_returns_none(tmp_path):
+    assert utils.load_game(str(tmp_path / "nope.json")) is None
+
+
+def test_failed_save_keeps_previous_file(tmp_path, game_state):
+    path = str(tmp_path / "save.json")
+    utils.save_game(game_state, path)
+    with open(path, "rb") as f:
+        before = f.read()
+
+    assert not utils.save_game(dict(game_state, bad=object()), path)
+    with open(path, "rb") as f:
+        assert f.read() == before
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_load_cache_returns_independent_states(tmp_path, game_state):
+    path = str(tmp_path / "save.json")
+    utils.save_game(game_state, path)
+
+    first = utils.load_game(path)
+    assert path in utils._LOAD_CACHE
+    first["player"]["troops"] = 1
+    second = utils.load_game(path)
+    assert second == game_state
+    assert second is not first
+
+
+def test_load_cache_sees_new_saves(tmp_path, game_state):
+    path = str(tmp_path / "save.json")
+    utils.save_game(game_state, path)
+    assert utils.load_game(path)["year"] == game_state["year"]
+
+    game_state["year"] += 1
+    utils.save_game(game_state, path)
+    assert utils.load_game(path)["year"] == game_state["year"]
+
+    st = os.stat(path)
+    assert utils._LOAD_CACHE[path][0] == (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def test_save_with_backup_writes_same_bytes(tmp_path, monkeypatch, game_state):
+    monkeypatch.chdir(tmp_path)
+    assert utils.save_game(game_state, "primary.json", backup=True)
+    with open("primary.json", "rb") as a, open(utils.BACKUP_FILENAME, "rb") as b:
+        assert a.read() == b.read()
+    assert not os.path.exists(utils.BACKUP_FILENAME + ".tmp")
+
+
+def test_failed_save_leaves_backup_alone(tmp_path, monkeypatch, game_state):
+    monkeypatch.chdir(tmp_path)
+    utils.save_game(game_state, "primary.json", backup=True)
+    with open(utils.BACKUP_FILENAME, "rb") as f:
+        before = f.read()
+
+    assert not utils.save_game(dict(game_state, bad=object()), "primary.json", backup=True)
+    with open(utils.BACKUP_FILENAME, "rb") as f:
+        assert f.read() == before
+
+
+def test_backup_copies_existing_save(tmp_path, monkeypatch, game_state):
+    monkeypatch.chdir(tmp_path)
+    utils.save_game(game_state, "primary.json")
+    assert utils.create_backup_save("primary.json")
+    with open("primary.json", "rb") as a, open(utils.BACKUP_FILENAME, "rb") as b:
+        assert a.read() == b.read()
+
+
+def test_backup_of_missing_save_fails(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert not utils.create_backup_save("nope.json")
+    assert not os.path.exists(utils.BACKUP_FILENAME)
+
+
+@needs_msgpack
+def test_msgpack_round_trip(tmp_path, game_state):
+    path = str(tmp_path / "save.msgpack")
+    assert utils.save_game_bin(game_state, path)
+    assert utils.load_game_bin(path) == game_state
+    assert utils.load_game(path) == game_state
+
+
+@needs_msgpack
+def test_msgpack_extension_falls_back_to_json(tmp_path, game_state):
+    path = str(tmp_path / "save.msgpack")
+    utils.save_game(game_state, path)
+    assert utils.load_game_bin(path) == game_state
+
+
+def test_save_game_bin_without_msgpack(tmp_path, monkeypatch, game_state):
+    monkeypatch.setattr(utils, "msgpack", None)
+    path = str(tmp_path / "save.msgpack")
+    assert not utils.save_game_bin(game_state, path)
+    assert not os.path.exists(path)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test the one-line status redraw (offline)
+"""
+
+import io
+
+from rich.console import Console
+
+import ui
+from data import get_initial_game_state
+
+
+def capture_console(monkeypatch, terminal):
+    console = Console(
+        file=io.StringIO(),
+        force_terminal=terminal,
+        color_system="standard" if terminal else None,
+        width=80,
+    )
+    monkeypatch.setattr(ui, "console", console)
+    return console
+
+
+def test_plain_status_line(monkeypatch):
+    console = capture_console(monkeypatch, terminal=False)
+    ui.show_status_fast(get_initial_game_state())
+    assert console.file.getvalue() == (
+        "Napoleon Bonaparte │ Troops: 50,000  Gold: 10,000  Morale: 100/100\n"
+    )
+
+
+def test_terminal_status_line_is_raw_ansi(monkeypatch):
+    console = capture_console(monkeypatch, terminal=True)
+    game_state = get_initial_game_state()
+    ui.show_status_fast(game_state)
+    assert console.file.getvalue() == ui._STATUS_TEMPLATE.format_map(game_state["player"])
+
+
+def test_markup_in_names_is_printed_literally(monkeypatch):
+    console = capture_console(monkeypatch, terminal=False)
+    game_state = get_initial_game_state()
+    game_state["player"]["name"] = "[bold]Nap"
+    ui.show_status_fast(game_state)
+    assert console.file.getvalue().startswith("[bold]Nap │")
+
+
+def test_status_line_keeps_its_place_in_a_frame(monkeypatch):
+    console = capture_console(monkeypatch, terminal=True)
+    with ui.turn_frame():
+        console.print("BEFORE")
+        ui.show_status_fast(get_initial_game_state())
+        console.print("AFTER")
+    output = console.file.getvalue()
+    assert output.index("BEFORE") < output.index("Troops") < output.index("AFTER")
+
+
+def test_frame_prints_directly_on_legacy_windows(monkeypatch):
+    console = capture_console(monkeypatch, terminal=False)
+    monkeypatch.setattr(console, "legacy_windows", True)
+    with ui.turn_frame():
+        console.print("INSIDE")
+        assert console.file.getvalue() == "INSIDE\n"
@@ -4,22 +4,32 @@ Napoleon's Campaign - UI Module
 Handles all user interface and display logic using Rich.
 """
 
+import functools
 import os
-from typing import Dict, List, Any, Tuple
-from rich.console import Console
-from data import get_trait, get_general, get_artifact, MAP_DIMENSIONS, TERRITORY_NODES, MAP_CONNECTIONS
+import sys
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, List, Any, Tuple
+from rich.console import Console, Group
+from data import get_trait, get_general, get_artifact, MAP_DIMENSIONS, TERRITORY_NODES, MAP_EDGE_ENDPOINTS
 from npc_system import get_available_npcs, get_npc
 from rich.table import Table
 from rich.panel import Panel
-from rich.markdown import Markdown
 from rich.prompt import Prompt, IntPrompt, Confirm
-from rich.layout import Layout
-from rich.align import Align
-from rich.text import Text
+from rich.text import Span, Text
 from rich import box
 
-# Initialize global console
-console = Console()
+# Markdown pulls in a parser; it is imported where it is first needed
+if TYPE_CHECKING:
+    from rich.markdown import Markdown
+
+# Initialize global console. When output is redirected there is no one to
+# see colours, so skip styling and the repr highlighter entirely; markup is
+# kept because the [tag] strings would otherwise be printed literally.
+if sys.stdout.isatty():
+    console = Console()
+else:
+    console = Console(no_color=True, highlight=False)
 
 # Nerd Font Icons
 ICON_TROOPS = ""
@@ -37,12 +47,64 @@ ICON_EXIT = ""
 ICON_GENERAL = ""
 ICON_ARTIFACT = ""
 
+# Static status labels, composed once so renders only append the numbers
+_TROOPS_PREFIX = Text(f"{ICON_TROOPS} Troops: ")
+_GOLD_PREFIX = Text(f"{ICON_GOLD} Gold:   ")
+_MORALE_PREFIX = Text(f"{ICON_MORALE} Morale: ")
+_TERRITORIES_PREFIX = Text(f"{ICON_TERRITORY} Territories: ")
+_ALLIES_PREFIX = Text(f"{ICON_ALLY} Allies:      ")
+_ENEMIES_PREFIX = Text(f"{ICON_ENEMY} Enemies:     ")
+
+_GAME_OVER_LABELS = tuple(Text(label) for label in (
+    f"{ICON_TROOPS} Troops",
+    f"{ICON_GOLD} Gold",
+    f"{ICON_MORALE} Morale",
+    f"{ICON_TERRITORY} Territories",
+    f"{ICON_ALLY} Allies",
+    f"{ICON_ENEMY} Enemies",
+    "Years in Power",
+    "Historical Accuracy",
+))
+
+_RESOURCE_ICONS = {"troops": ICON_TROOPS, "gold": ICON_GOLD, "morale": ICON_MORALE}
+_RESOURCE_LABELS = {"troops": "Troops", "gold": "Gold", "morale": "Morale"}
+
+# One-line status for quick redraws, written without Rich rendering
+_STATUS_TEMPLATE = (
+    "\x1b[1;33m{name}\x1b[0m │ Troops: \x1b[36m{troops:,}\x1b[0m  "
+    "Gold: \x1b[36m{gold:,}\x1b[0m  Morale: \x1b[36m{morale}/100\x1b[0m\n"
+)
+_STATUS_TEMPLATE_PLAIN = "{name} │ Troops: {troops:,}  Gold: {gold:,}  Morale: {morale}/100\n"
+
+# Parsed event descriptions, keyed by (event id, description)
+_EVENT_MARKDOWN_CACHE: "OrderedDict[Tuple[str, str], Markdown]" = OrderedDict()
+_EVENT_MARKDOWN_CACHE_SIZE = 32
+
 
 def clear_screen() -> None:
     """Clear the terminal screen."""
     console.clear()
 
 
+@contextmanager
+def turn_frame():
+    """Buffer all console output inside the block and write it in one go.
+    
+    Keep prompts outside the block; they need the frame on screen first.
+    The legacy Windows console can't take raw ANSI, so it prints as usual.
+    """
+    if console.legacy_windows:
+        yield
+        return
+    capture = console.capture()
+    try:
+        with capture:
+            yield
+    finally:
+        console.file.write(capture.get())
+        console.file.flush()
+
+
 def show_main_menu() -> int:
     """Display the main menu and get user choice."""
     console.print(
@@ -75,21 +137,23 @@ def show_status(game_state: Dict[str, Any]) -> None:
     table.add_column("Resources", style="cyan")
     table.add_column("Diplomacy", style="magenta")
     
-    resources = (
-        f"{ICON_TROOPS} Troops: {player['troops']:,}\n"
-        f"{ICON_GOLD} Gold:   {player['gold']:,}\n"
-        f"{ICON_MORALE} Morale: {player['morale']}/100"
+    # Assemble styled Text directly so Rich skips the markup tokenizer
+    resources = Text.assemble(
+        _TROOPS_PREFIX, (f"{player['troops']:,}\n", "bold"),
+        _GOLD_PREFIX, (f"{player['gold']:,}\n", "bold"),
+        _MORALE_PREFIX, (f"{player['morale']}/100", "bold"),
     )
     
-    diplomacy = (
-        f"{ICON_TERRITORY} Territories: {len(player['territories'])}\n"
-        f"{ICON_ALLY} Allies:      {len(player['allies'])}\n"
-        f"{ICON_ENEMY} Enemies:     {len(player['enemies'])}"
+    diplomacy = Text.assemble(
+        _TERRITORIES_PREFIX, (f"{len(player['territories'])}\n", "bold"),
+        _ALLIES_PREFIX, (f"{len(player['allies'])}\n", "bold"),
+        _ENEMIES_PREFIX, (str(len(player['enemies'])), "bold"),
     )
     
     table.add_row(player['name'], resources, diplomacy)
     
-    console.print(table)
+    # Collect every section and render them in a single print
+    renderables = [table]
 
     # Show Traits
     if player.get("traits"):
@@ -99,7 +163,7 @@ def show_status(game_state: Dict[str, Any]) -> None:
             traits_text.append(f"• {trait['name']}: ", style="bold yellow")
             traits_text.append(f"{trait['description']}\n")
         
-        console.print(Panel(traits_text, title="Active Traits", border_style="yellow"))
+        renderables.append(Panel(traits_text, title="Active Traits", border_style="yellow"))
 
     # Show Generals
     if player.get("generals"):
@@ -110,7 +174,7 @@ def show_status(game_state: Dict[str, Any]) -> None:
             generals_text.append(f"{ICON_GENERAL} {general['name']} ({general['status'].title()}): ", style=f"bold {status_color}")
             generals_text.append(f"{general['description']}\n")
         
-        console.print(Panel(generals_text, title="Generals", border_style="blue"))
+        renderables.append(Panel(generals_text, title="Generals", border_style="blue"))
 
     # Show Artifacts
     if player.get("artifacts"):
@@ -120,125 +184,280 @@ def show_status(game_state: Dict[str, Any]) -> None:
             artifacts_text.append(f"{ICON_ARTIFACT} {artifact['name']}: ", style="bold magenta")
             artifacts_text.append(f"{artifact['description']}\n")
         
-        console.print(Panel(artifacts_text, title="Artifacts", border_style="magenta"))
+        renderables.append(Panel(artifacts_text, title="Artifacts", border_style="magenta"))
+
+    console.print(Group(*renderables))
+
+
+def show_status_fast(game_state: Dict[str, Any]) -> None:
+    """Display a one-line status, bypassing Rich's render pipeline.
+    
+    Meant for redraws within a turn; show_status remains the full view.
+    """
+    template = _STATUS_TEMPLATE if console.is_terminal else _STATUS_TEMPLATE_PLAIN
+    # console.out writes the text as-is but still honours capture/turn_frame
+    console.out(template.format_map(game_state["player"]), end="", highlight=False)
+
+
+def _bresenham(x0: int, y0: int, x1: int, y1: int) -> List[Tuple[int, int]]:
+    """Return the cells on the line from (x0, y0) to (x1, y1), inclusive."""
+    points = []
+    dx = abs(x1 - x0)
+    dy = abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx - dy
+    
+    while True:
+        points.append((x0, y0))
+        if x0 == x1 and y0 == y1:
+            return points
+            
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            x0 += sx
+        if e2 < dx:
+            err += dx
+            y0 += sy
+
+
+# The canvas stores one byte per cell. Labels are ASCII; the few line
+# glyphs the map uses are stored as control bytes and swapped back in
+# when the canvas is rendered.
+_CANVAS_GLYPHS = "·─│┌┐└┘"
+_GLYPH_CODES = {glyph: code for code, glyph in enumerate(_CANVAS_GLYPHS, 1)}
+_GLYPH_DECODE = {code: glyph for glyph, code in _GLYPH_CODES.items()}
+_BLANK = ord(" ")
+
+# Cell styles are one byte too: 0 is unstyled, 1-8 index the standard
+# terminal palette (SGR 30-37) and _BOLD is or-ed in for bold text.
+_PALETTE = ("black", "red", "green", "yellow", "blue", "magenta", "cyan", "white")
+_BOLD = 0x10
+_STYLE_NAMES = {0: None}
+_STYLE_SGR = {0: "\x1b[0m"}
+for _index, _color in enumerate(_PALETTE, 1):
+    _STYLE_NAMES[_index] = _color
+    _STYLE_NAMES[_index | _BOLD] = f"bold {_color}"
+    _STYLE_SGR[_index] = f"\x1b[0;{29 + _index}m"
+    _STYLE_SGR[_index | _BOLD] = f"\x1b[0;1;{29 + _index}m"
+del _index, _color
+
+
+def _glyph_byte(char: str) -> int:
+    """Return the canvas byte used to store a glyph."""
+    return _GLYPH_CODES.get(char) or ord(char)
+
+
+def _style_byte(color: str, bold: bool = False) -> int:
+    """Return the canvas byte for a palette color name."""
+    code = _PALETTE.index(color) + 1
+    return code | _BOLD if bold else code
 
 
 class MapCanvas:
-    """A simple character-based canvas for drawing the map."""
+    """A simple character-based canvas for drawing the map.
+    
+    Glyphs live in a flat bytearray indexed by ``y * stride + x``, with
+    style bytes in a parallel bytearray, so rendering works on runs of
+    equally styled cells instead of parsing per-cell markup.
+    """
     
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.grid = [[" " for _ in range(width)] for _ in range(height)]
+        self.stride = width
+        self.grid = bytearray(b" " * (width * height))
+        self.style_grid = bytearray(width * height)
         
     def draw_line(self, x0: int, y0: int, x1: int, y1: int, char: str = "·"):
         """Draw a line using Bresenham's algorithm."""
-        dx = abs(x1 - x0)
-        dy = abs(y1 - y0)
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        err = dx - dy
-        
-        while True:
-            if 0 <= x0 < self.width and 0 <= y0 < self.height:
-                # Don't overwrite existing boxes or labels if possible, but for lines we might need to.
-                # Let's just draw.
-                if self.grid[y0][x0] == " ":
-                    self.grid[y0][x0] = char
-            
-            if x0 == x1 and y0 == y1:
-                break
-                
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x0 += sx
-            if e2 < dx:
-                err += dx
-                y0 += sy
+        code = _glyph_byte(char)
+        for x, y in _bresenham(x0, y0, x1, y1):
+            if 0 <= x < self.width and 0 <= y < self.height:
+                # Don't overwrite existing boxes or labels
+                i = y * self.stride + x
+                if self.grid[i] == _BLANK:
+                    self.grid[i] = code
+
+    def _put(self, x: int, y: int, char: str, style: int):
+        """Write a styled glyph if the cell is on the canvas."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = y * self.stride + x
+            self.grid[i] = _glyph_byte(char)
+            self.style_grid[i] = style
+
+    def _fill_row(self, x: int, y: int, w: int, char: str, style: int):
+        """Fill a horizontal run of cells, clipped to the canvas."""
+        start = max(x, 0)
+        end = min(x + w, self.width)
+        if 0 <= y < self.height and start < end:
+            row = y * self.stride
+            self.grid[row + start:row + end] = bytes((_glyph_byte(char),)) * (end - start)
+            self.style_grid[row + start:row + end] = bytes((style,)) * (end - start)
+
+    def _put_text(self, x: int, y: int, text: str, style: int):
+        """Write an ASCII string as one slice, clipped to the canvas."""
+        start = max(x, 0)
+        end = min(x + len(text), self.width)
+        if 0 <= y < self.height and start < end:
+            row = y * self.stride
+            self.grid[row + start:row + end] = text[start - x:end - x].encode("ascii")
+            self.style_grid[row + start:row + end] = bytes((style,)) * (end - start)
 
     def draw_box(self, x: int, y: int, w: int, h: int, label: str, border_color: str = "white"):
         """Draw a box with a label."""
+        border = _style_byte(border_color)
+        
         # Draw top and bottom
-        for i in range(w):
-            if 0 <= x + i < self.width:
-                if 0 <= y < self.height:
-                    self.grid[y][x + i] = f"[{border_color}]─[/{border_color}]"
-                if 0 <= y + h - 1 < self.height:
-                    self.grid[y + h - 1][x + i] = f"[{border_color}]─[/{border_color}]"
+        self._fill_row(x, y, w, "─", border)
+        self._fill_row(x, y + h - 1, w, "─", border)
         
         # Draw sides
         for i in range(h):
-            if 0 <= y + i < self.height:
-                if 0 <= x < self.width:
-                    self.grid[y + i][x] = f"[{border_color}]│[/{border_color}]"
-                if 0 <= x + w - 1 < self.width:
-                    self.grid[y + i][x + w - 1] = f"[{border_color}]│[/{border_color}]"
+            self._put(x, y + i, "│", border)
+            self._put(x + w - 1, y + i, "│", border)
                     
         # Corners
-        if 0 <= y < self.height and 0 <= x < self.width:
-            self.grid[y][x] = f"[{border_color}]┌[/{border_color}]"
-        if 0 <= y < self.height and 0 <= x + w - 1 < self.width:
-            self.grid[y][x + w - 1] = f"[{border_color}]┐[/{border_color}]"
-        if 0 <= y + h - 1 < self.height and 0 <= x < self.width:
-            self.grid[y + h - 1][x] = f"[{border_color}]└[/{border_color}]"
-        if 0 <= y + h - 1 < self.height and 0 <= x + w - 1 < self.width:
-            self.grid[y + h - 1][x + w - 1] = f"[{border_color}]┘[/{border_color}]"
+        self._put(x, y, "┌", border)
+        self._put(x + w - 1, y, "┐", border)
+        self._put(x, y + h - 1, "└", border)
+        self._put(x + w - 1, y + h - 1, "┘", border)
             
         # Label
         label_x = x + (w - len(label)) // 2
         label_y = y + h // 2
-        if 0 <= label_y < self.height:
-            for i, char in enumerate(label):
-                if 0 <= label_x + i < self.width:
-                    self.grid[label_y][label_x + i] = f"[bold {border_color}]{char}[/bold {border_color}]"
+        self._put_text(label_x, label_y, label, _style_byte(border_color, bold=True))
+
+    def _rows(self) -> List[str]:
+        """Decode the glyph grid into one string per row."""
+        cells = self.grid.decode("latin-1").translate(_GLYPH_DECODE)
+        return [cells[i:i + self.width] for i in range(0, len(cells), self.stride)]
+
+    def _runs(self, y: int):
+        """Yield (start, end, style) for each run of equally styled cells in a row."""
+        row = y * self.stride
+        styles = self.style_grid[row:row + self.width]
+        run_start = 0
+        for x in range(1, self.width):
+            if styles[x] != styles[run_start]:
+                yield run_start, x, styles[run_start]
+                run_start = x
+        yield run_start, self.width, styles[run_start]
 
     def render(self) -> Text:
         """Render the grid to a Text object."""
-        output = Text()
-        for row in self.grid:
-            output.append("".join(row) + "\n")
-        return output
+        # One span per styled run. Text offsets gain one per row for the
+        # newline separators.
+        spans = []
+        for y in range(self.height):
+            offset = y * (self.width + 1)
+            for start, end, style in self._runs(y):
+                if style:
+                    spans.append(Span(offset + start, offset + end, _STYLE_NAMES[style]))
+            
+        return Text("\n".join(self._rows()) + "\n", spans=spans)
+
+    def render_ansi(self, border_color: str = None) -> str:
+        """Render the grid straight to ANSI escape sequences.
+        
+        Emits one SGR sequence per styled run and resets at the end of
+        every row, skipping Rich's segment pipeline entirely.
+        
+        Args:
+            border_color: If given, frame each row with vertical borders
+                in this palette color
+                
+        Returns:
+            The rendered rows, each terminated by a newline
+        """
+        if border_color:
+            side = f"{_STYLE_SGR[_style_byte(border_color)]}│\x1b[0m"
+            left, right = f"{side} ", f" {side}\n"
+        else:
+            left, right = "", "\n"
+            
+        lines = []
+        for y, row in enumerate(self._rows()):
+            parts = [left]
+            for start, end, style in self._runs(y):
+                parts.append(_STYLE_SGR[style])
+                parts.append(row[start:end])
+            parts.append("\x1b[0m")
+            parts.append(right)
+            lines.append("".join(parts))
+        return "".join(lines)
+
+
+# Map grid with only the connections drawn. The geometry is fixed, so
+# it is built on first use and copied for every later map. Connections
+# are unstyled, so a fresh style grid needs no copy.
+_BASE_CANVAS_GRID = None
+
+
+def _new_map_canvas() -> MapCanvas:
+    """Return a canvas with the territory connections already drawn."""
+    global _BASE_CANVAS_GRID
+    
+    canvas = MapCanvas(MAP_DIMENSIONS[0], MAP_DIMENSIONS[1])
+    if _BASE_CANVAS_GRID is not None:
+        canvas.grid = bytearray(_BASE_CANVAS_GRID)
+        return canvas
+    
+    for x0, y0, x1, y1 in MAP_EDGE_ENDPOINTS:
+        canvas.draw_line(x0, y0, x1, y1, char="·")
+    
+    _BASE_CANVAS_GRID = bytes(canvas.grid)
+    return canvas
 
 
 def show_map(game_state: Dict[str, Any]) -> None:
     """Display the game map."""
-    canvas = MapCanvas(MAP_DIMENSIONS[0], MAP_DIMENSIONS[1])
+    canvas = _new_map_canvas()
     player = game_state["player"]
     
-    # Draw connections first
-    for start_node, end_node in MAP_CONNECTIONS:
-        start = TERRITORY_NODES[start_node]
-        end = TERRITORY_NODES[end_node]
-        
-        # Calculate centers
-        start_x = start["x"] + start["w"] // 2
-        start_y = start["y"] + start["h"] // 2
-        end_x = end["x"] + end["w"] // 2
-        end_y = end["y"] + end["h"] // 2
-        
-        canvas.draw_line(start_x, start_y, end_x, end_y, char="·")
+    # Sets for O(1) membership; the saved state keeps lists for JSON
+    owned = set(player["territories"])
+    enemies = set(player["enemies"])
+    allies = set(player["allies"])
         
     # Draw territories
     for name, node in TERRITORY_NODES.items():
         # Determine color
-        if name in player["territories"]:
+        if name in owned:
             color = "blue"
-        elif name in player["enemies"]:
+        elif name in enemies:
             color = "red"
-        elif name in player["allies"]:
+        elif name in allies:
             color = "green"
         else:
             color = "white"
             
         canvas.draw_box(node["x"], node["y"], node["w"], node["h"], node["label"], color)
         
-    console.print(Panel(canvas.render(), title="Strategic Map", border_style="blue"))
+    # On a colour terminal wide enough for the framed map, emit it as raw
+    # ANSI in a single call. console.out passes the escapes through as-is
+    # and still respects capture, so the map stays in order in turn_frame().
+    if (console.is_terminal and console.color_system and not console.legacy_windows
+            and console.width >= canvas.width + 4):
+        console.out(_ansi_map_panel(canvas, "Strategic Map", "blue"), end="", highlight=False)
+    else:
+        console.print(Panel(canvas.render(), title="Strategic Map", border_style="blue"))
+
+
+def _ansi_map_panel(canvas: MapCanvas, title: str, border_color: str) -> str:
+    """Frame a rendered canvas in a rounded, titled border like Panel's."""
+    sgr = _STYLE_SGR[_style_byte(border_color)]
+    inner = canvas.width + 2
+    title = f" {title} "
+    left = (inner - len(title)) // 2
+    top = f"{sgr}╭{'─' * left}{title}{'─' * (inner - left - len(title))}╮\x1b[0m\n"
+    bottom = f"{sgr}╰{'─' * inner}╯\x1b[0m\n"
+    return top + canvas.render_ansi(border_color) + bottom
 
 
 def show_available_npcs(game_state: Dict[str, Any]) -> None:
     """Show list of available NPCs to talk to."""
-    from rich.prompt import Prompt
     
     available_ids = get_available_npcs(game_state)
     
@@ -265,7 +484,6 @@ def show_available_npcs(game_state: Dict[str, Any]) -> None:
 def show_npc_dialogue(npc: Any, response: str, relationship: int, 
                      relationship_change: int) -> None:
     """Display NPC dialogue response."""
-    from rich.align import Align
     
     # Relationship indicator
     if relationship > 70:
@@ -301,6 +519,23 @@ def show_npc_dialogue(npc: Any, response: str, relationship: int,
     ))
 
 
+def _get_event_markdown(event: Dict[str, Any]) -> "Markdown":
+    """Return the parsed description for an event, reusing earlier parses."""
+    from rich.markdown import Markdown
+    
+    # LLM events share generic ids, so the description is part of the key
+    key = (event.get("id", ""), event["description"])
+    description = _EVENT_MARKDOWN_CACHE.get(key)
+    if description is None:
+        description = Markdown(event["description"])
+        _EVENT_MARKDOWN_CACHE[key] = description
+        if len(_EVENT_MARKDOWN_CACHE) > _EVENT_MARKDOWN_CACHE_SIZE:
+            _EVENT_MARKDOWN_CACHE.popitem(last=False)
+    else:
+        _EVENT_MARKDOWN_CACHE.move_to_end(key)
+    return description
+
+
 def show_event(event: Dict[str, Any]) -> None:
     """Display a historical event."""
     is_random = event.get("type") == "random"
@@ -311,7 +546,7 @@ def show_event(event: Dict[str, Any]) -> None:
     if "year" in event:
         title += f" ({event['year']})"
         
-    description = Markdown(event['description'])
+    description = _get_event_markdown(event)
     
     console.print(Panel(description, title=title, border_style=border_style, padding=(1, 2)))
 
@@ -322,16 +557,25 @@ def show_event(event: Dict[str, Any]) -> None:
     console.print(f"\n[italic]Turn: {event.get('turn_count', 'N/A')}[/italic]", style="dim")
 
 
+_CHOICE_PROMPT = "\n[bold green]Enter your choice (or 'm' for map)[/bold green]"
+
+
+@functools.lru_cache(maxsize=8)
+def _choices(num_choices: int) -> List[str]:
+    """Return the accepted answers for an event with num_choices options.
+    
+    Events only ever offer a handful of choices, so the lists are built
+    once per size and shared; callers must not mutate them.
+    """
+    return [str(i) for i in range(1, num_choices + 1)] + ["m", "M"]
+
+
 def get_player_choice(event: Dict[str, Any], game_state: Dict[str, Any]) -> int:
     """Get the player's choice for an event."""
-    num_choices = len(event["choices"])
-    valid_choices = [str(i) for i in range(1, num_choices + 1)]
+    valid_choices = _choices(len(event["choices"]))
     
     while True:
-        choice = Prompt.ask(
-            f"\n[bold green]Enter your choice (or 'm' for map)[/bold green]", 
-            choices=valid_choices + ["m", "M"]
-        ).lower()
+        choice = Prompt.ask(_CHOICE_PROMPT, choices=valid_choices).lower()
         
         if choice == "m":
             show_map(game_state)
@@ -351,27 +595,27 @@ def show_game_over(game_state: Dict[str, Any]) -> None:
         style = "bold red"
         message = "The empire has fallen. Your legacy will be debated for centuries."
 
-    console.print(Panel(f"[center]{message}[/center]", title=f"[{style}]{title}[/{style}]", border_style=style.split()[-1]))
+    banner = Panel(f"[center]{message}[/center]", title=f"[{style}]{title}[/{style}]", border_style=style.split()[-1])
 
     player = game_state["player"]
     stats_table = Table(title="Final Statistics", show_header=False, box=box.SIMPLE)
-    stats_table.add_row(f"{ICON_TROOPS} Troops", f"{player['troops']:,}")
-    stats_table.add_row(f"{ICON_GOLD} Gold", f"{player['gold']:,}")
-    stats_table.add_row(f"{ICON_MORALE} Morale", f"{player['morale']}/100")
-    stats_table.add_row(f"{ICON_TERRITORY} Territories", str(len(player['territories'])))
-    stats_table.add_row(f"{ICON_ALLY} Allies", str(len(player['allies'])))
-    stats_table.add_row(f"{ICON_ENEMY} Enemies", str(len(player['enemies'])))
-    stats_table.add_row("Years in Power", str(game_state['year'] - 1796))
-    stats_table.add_row("Historical Accuracy", f"{game_state['historical_accuracy']}%")
+    stats = (
+        f"{player['troops']:,}",
+        f"{player['gold']:,}",
+        f"{player['morale']}/100",
+        str(len(player['territories'])),
+        str(len(player['allies'])),
+        str(len(player['enemies'])),
+        str(game_state['year'] - 1796),
+        f"{game_state['historical_accuracy']}%",
+    )
+    for label, value in zip(_GAME_OVER_LABELS, stats):
+        stats_table.add_row(label, Text(value))
     
-    console.print(stats_table)
+    console.print(Group(banner, stats_table))
 
 
-def show_instructions() -> None:
-    """Display detailed game instructions."""
-    clear_screen()
-    
-    markdown_text = """
+INSTRUCTIONS_MARKDOWN = """
 # NAPOLEON'S CAMPAIGN - INSTRUCTIONS
 
 ## OVERVIEW
@@ -404,9 +648,22 @@ You are **Napoleon Bonaparte**, commanding France through the turbulent years of
 - Use number keys to select options
 - Type 'save' to save your progress
 - Follow on-screen prompts
-    """
+"""
+
+# Parsed on first display, then reused
+_instructions_renderable = None
+
+
+def show_instructions() -> None:
+    """Display detailed game instructions."""
+    global _instructions_renderable
     
-    console.print(Markdown(markdown_text))
+    if _instructions_renderable is None:
+        from rich.markdown import Markdown
+        _instructions_renderable = Markdown(INSTRUCTIONS_MARKDOWN)
+    
+    clear_screen()
+    console.print(_instructions_renderable)
     console.input("\n[dim]Press Enter to continue...[/dim]")
 
 
@@ -442,56 +699,68 @@ def show_resource_change(changes: Dict[str, int]) -> None:
     if not changes:
         return
         
-    text = Text()
-    for resource, change in changes.items():
-        if change != 0:
-            sign = "+" if change > 0 else ""
-            color = "green" if change > 0 else "red"
-            
-            icon = ""
-            if resource == "troops": icon = ICON_TROOPS
-            elif resource == "gold": icon = ICON_GOLD
-            elif resource == "morale": icon = ICON_MORALE
-            
-            text.append(f"{icon} {resource.title()}: {sign}{change:,}\n", style=color)
+    parts = [
+        (
+            f"{_RESOURCE_ICONS.get(resource, '')} "
+            f"{_RESOURCE_LABELS.get(resource) or resource.title()}: "
+            f"{'+' if change > 0 else ''}{change:,}\n",
+            "green" if change > 0 else "red",
+        )
+        for resource, change in changes.items()
+        if change != 0
+    ]
             
+    text = Text.assemble(*parts)
     console.print(Panel(text, title="Resource Changes", border_style="blue", width=40))
 
 
 def show_territories(territories: List[str]) -> None:
     """Display controlled territories."""
     if territories:
-        console.print(f"\n[bold]Controlled Territories ({len(territories)}):[/bold]")
-        for territory in territories:
-            console.print(f"  • {territory}")
+        text = Text()
+        text.append(f"\nControlled Territories ({len(territories)}):\n", style="bold")
+        text.append("\n".join(f"  • {territory}" for territory in territories))
+        console.print(text)
     else:
         console.print("\n[dim]No territories controlled.[/dim]")
 
 
 def show_allies_and_enemies(allies: List[str], enemies: List[str]) -> None:
     """Display current diplomatic status."""
+    # Build both sections into one Text so they render in a single pass
+    text = Text()
     if allies:
-        console.print(f"\n[bold green]{ICON_ALLY} Allies ({len(allies)}):[/bold green]")
-        for ally in allies:
-            console.print(f"  ✓ {ally}")
+        text.append(f"\n{ICON_ALLY} Allies ({len(allies)}):\n", style="bold green")
+        text.append("".join(f"  ✓ {ally}\n" for ally in allies))
 
     if enemies:
-        console.print(f"\n[bold red]{ICON_ENEMY} Enemies ({len(enemies)}):[/bold red]")
-        for enemy in enemies:
-            console.print(f"  ✗ {enemy}")
+        text.append(f"\n{ICON_ENEMY} Enemies ({len(enemies)}):\n", style="bold red")
+        text.append("".join(f"  ✗ {enemy}\n" for enemy in enemies))
+
+    if text:
+        text.rstrip()
+        console.print(text)
+
+
+_HISTORICAL_NOTES = {
+    "italian_campaign_1796": "Napoleon's first major victory established his reputation as a military genius.",
+    "austerlitz_campaign_1805": "Considered Napoleon's masterpiece, this battle destroyed the Third Coalition.",
+    "russian_campaign_1812": "The disastrous invasion led to the collapse of the Grande Armée.",
+    "waterloo_1815": "The final defeat ended Napoleon's Hundred Days and his imperial ambitions.",
+}
+
+# Notes never change, so build their panels once at import
+_HISTORICAL_NOTE_PANELS = {
+    event_id: Panel(Text(note, style="italic"), title="📚 Historical Note", border_style="yellow")
+    for event_id, note in _HISTORICAL_NOTES.items()
+}
 
 
 def show_historical_note(event_id: str) -> None:
     """Display educational historical notes."""
-    notes = {
-        "italian_campaign_1796": "Napoleon's first major victory established his reputation as a military genius.",
-        "austerlitz_campaign_1805": "Considered Napoleon's masterpiece, this battle destroyed the Third Coalition.",
-        "russian_campaign_1812": "The disastrous invasion led to the collapse of the Grande Armée.",
-        "waterloo_1815": "The final defeat ended Napoleon's Hundred Days and his imperial ambitions.",
-    }
-
-    if event_id in notes:
-        console.print(Panel(f"[italic]{notes[event_id]}[/italic]", title="📚 Historical Note", border_style="yellow"))
+    panel = _HISTORICAL_NOTE_PANELS.get(event_id)
+    if panel is not None:
+        console.print(panel)
 
 
 def show_loading_message(message: str = "Loading...") -> None:
@@ -6,12 +6,118 @@ Contains utility functions, input validation, and helper methods.
 
 import json
 import os
-from typing import Dict, Any, Optional, Callable
+import random
+import sys
+from typing import Dict, Any, Optional, Callable, Tuple
+
+# orjson is an optional, much faster JSON codec; saves stay plain JSON
+# either way, so files written by one path load with the other.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# zstandard is optional too. When present, saves are compressed; loading
+# checks the frame magic so older plain-JSON saves keep working.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Bound once; these are called on every turn
+_uniform = random.uniform
+_choice = random.choice
+_rand = random.random
+
+# msgpack enables the optional binary save format (save_game_bin)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_EXTENSION = ".msgpack"
+
+BACKUP_FILENAME = "napoleon_save_backup.json"
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ZSTD_LEVEL = 3
+
+
+def _encode_state(game_state: Dict[str, Any], pretty: bool = False) -> bytes:
+    """Serialize a game state into the bytes written to a save file.
+
+    Saves are compact JSON. A pretty save is indented and left
+    uncompressed so it can be read by hand.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        payload = orjson.dumps(game_state, option=option)
+    elif pretty:
+        payload = json.dumps(game_state, indent=2).encode()
+    else:
+        payload = json.dumps(game_state, separators=(",", ":")).encode()
+
+    if zstandard is not None and not pretty:
+        payload = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+    return payload
+
+
+def _decompress_state(payload: bytes) -> bytes:
+    """Return the JSON bytes of a save file, compressed or not."""
+    if payload.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError("save file is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    return payload
+
+
+def _parse_state(payload: bytes) -> Dict[str, Any]:
+    """Parse the JSON bytes of a save file."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _unpack_state(payload: bytes) -> Dict[str, Any]:
+    """Parse the bytes of a MessagePack save file."""
+    return msgpack.unpackb(payload, raw=False)
+
+
+def _write_atomic(filename: str, payload: bytes) -> None:
+    """Write a save through a synced temp file renamed over the target."""
+    tmp_filename = filename + ".tmp"
+    try:
+        with open(tmp_filename, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+
+
+# Decompressed payloads of recently loaded saves and the parser that reads
+# them, keyed by filename and checked against (inode, mtime_ns, size).
+# Reloading an unchanged save skips the read and decompression; it is still
+# parsed so every caller gets its own state to mutate, which is cheaper than
+# deep-copying a cached dict.
+_LOAD_CACHE: Dict[
+    str, Tuple[Tuple[int, int, int], bytes, Callable[[bytes], Dict[str, Any]]]
+] = {}
+
+
+# Windows 10+ consoles only interpret ANSI escapes once VT processing is
+# on; an empty system() call switches it on for this process.
+if os.name == "nt":
+    os.system("")
 
 
 def clear_screen() -> None:
     """Clear the terminal screen."""
-    os.system("clear" if os.name == "posix" else "cls")
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
 
 def validate_choice(choice: int, min_val: int, max_val: int) -> bool:
@@ -40,11 +146,47 @@ def get_user_input(
             print(f"Please enter a valid {input_type.__name__}.")
 
 
-def save_game(game_state: Dict[str, Any], filename: str = "napoleon_save.json") -> bool:
-    """Save the current game state to a file."""
+def save_game(
+    game_state: Dict[str, Any],
+    filename: str = "napoleon_save.json",
+    pretty: bool = False,
+    backup: bool = False,
+) -> bool:
+    """Save the current game state to a file.
+
+    The state is written to a temporary file, synced to disk and then
+    renamed over the target, so a crash mid-save never leaves a truncated
+    save behind. Pass pretty=True for an indented, uncompressed export,
+    and backup=True to also write the same bytes to BACKUP_FILENAME.
+    """
+    try:
+        payload = _encode_state(game_state, pretty)
+        _write_atomic(filename, payload)
+    except Exception as e:
+        print(f"Error saving game: {e}")
+        return False
+
+    if backup:
+        try:
+            _write_atomic(BACKUP_FILENAME, payload)
+        except Exception as e:
+            # The primary save is safe; only the backup is stale
+            print(f"Error writing backup save: {e}")
+    return True
+
+
+def save_game_bin(
+    game_state: Dict[str, Any], filename: str = "napoleon_save" + MSGPACK_EXTENSION
+) -> bool:
+    """Save the current game state in the binary MessagePack format.
+
+    Requires the optional msgpack package. load_game reads these files
+    back when the filename ends in .msgpack.
+    """
     try:
-        with open(filename, "w") as f:
-            json.dump(game_state, f, indent=2)
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed")
+        _write_atomic(filename, msgpack.packb(game_state, use_bin_type=True))
         return True
     except Exception as e:
         print(f"Error saving game: {e}")
@@ -54,17 +196,47 @@ def save_game(game_state: Dict[str, Any], filename: str = "napoleon_save.json")
 def load_game(filename: str = "napoleon_save.json") -> Optional[Dict[str, Any]]:
     """Load a saved game state from a file."""
     try:
-        if not os.path.exists(filename):
+        try:
+            st = os.stat(filename)
+        except FileNotFoundError:
             return None
 
-        with open(filename, "r") as f:
-            game_state = json.load(f)
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _LOAD_CACHE.get(filename)
+        if cached is not None and cached[0] == signature:
+            return cached[2](cached[1])
+
+        with open(filename, "rb") as f:
+            payload = f.read()
+
+        # .msgpack files are tried as MessagePack first; anything that does
+        # not unpack cleanly is read as a JSON save
+        parse = None
+        if msgpack is not None and filename.endswith(MSGPACK_EXTENSION):
+            try:
+                game_state = _unpack_state(payload)
+                parse = _unpack_state
+            except ValueError:
+                pass
+        if parse is None:
+            payload = _decompress_state(payload)
+            game_state = _parse_state(payload)
+            parse = _parse_state
+
+        _LOAD_CACHE[filename] = (signature, payload, parse)
         return game_state
     except Exception as e:
         print(f"Error loading game: {e}")
         return None
 
 
+def load_game_bin(
+    filename: str = "napoleon_save" + MSGPACK_EXTENSION,
+) -> Optional[Dict[str, Any]]:
+    """Load a game state saved with save_game_bin."""
+    return load_game(filename)
+
+
 def format_number(number: int) -> str:
     """Format a number with commas for readability."""
     return f"{number:,}"
@@ -79,69 +251,78 @@ def calculate_percentage(current: int, maximum: int) -> float:
 
 def clamp_value(value: int, min_val: int, max_val: int) -> int:
     """Clamp a value between minimum and maximum."""
-    return max(min_val, min(max_val, value))
+    if value < min_val:
+        return min_val
+    if value > max_val:
+        return max_val
+    return value
+
+
+_SEASON_NAMES = {
+    "spring": "Spring",
+    "summer": "Summer",
+    "autumn": "Autumn",
+    "winter": "Winter",
+}
 
 
 def get_season_name(season: str) -> str:
     """Get the display name for a season."""
-    season_names = {
-        "spring": "Spring",
-        "summer": "Summer",
-        "autumn": "Autumn",
-        "winter": "Winter",
-    }
-    return season_names.get(season, season.title())
+    return _SEASON_NAMES.get(season) or season.title()
 
 
 def calculate_battle_casualties(troops: int, intensity: str = "normal") -> int:
     """Calculate battle casualties based on intensity."""
     if intensity == "major":
-        casualty_rate = random.uniform(0.15, 0.30)
+        casualty_rate = _uniform(0.15, 0.30)
     elif intensity == "siege":
-        casualty_rate = random.uniform(0.05, 0.15)
+        casualty_rate = _uniform(0.05, 0.15)
     else:  # normal
-        casualty_rate = random.uniform(0.08, 0.20)
+        casualty_rate = _uniform(0.08, 0.20)
 
     return int(troops * casualty_rate)
 
 
+# Built once; generate_random_event hands out these shared dicts, so
+# callers must treat them as read-only
+_EVENTS = (
+    {
+        "title": "Plague Outbreak",
+        "description": "Disease spreads through your troops.",
+        "effects": {"troops": -2000, "morale": -10},
+    },
+    {
+        "title": "Economic Boom",
+        "description": "Trade flourishes in your territories.",
+        "effects": {"gold": 5000, "morale": 5},
+    },
+    {
+        "title": "Desertion",
+        "description": "Some troops desert due to poor conditions.",
+        "effects": {"troops": -1000, "morale": -5},
+    },
+)
+
+# Chance of a random event each turn
+_RANDOM_EVENT_CHANCE = 0.2
+
+
 def generate_random_event() -> Optional[Dict[str, Any]]:
     """Generate a random event (for future expansion)."""
-    events = [
-        {
-            "title": "Plague Outbreak",
-            "description": "Disease spreads through your troops.",
-            "effects": {"troops": -2000, "morale": -10},
-        },
-        {
-            "title": "Economic Boom",
-            "description": "Trade flourishes in your territories.",
-            "effects": {"gold": 5000, "morale": 5},
-        },
-        {
-            "title": "Desertion",
-            "description": "Some troops desert due to poor conditions.",
-            "effects": {"troops": -1000, "morale": -5},
-        },
-    ]
-
-    # 20% chance of random event
-    if random.random() < 0.2:
-        return random.choice(events)
-
-    return None
+    return _choice(_EVENTS) if _rand() < _RANDOM_EVENT_CHANCE else None
 
 
 def calculate_historical_accuracy(game_state: Dict[str, Any]) -> int:
     """Calculate how closely the player follows historical events."""
     # Simplified calculation - in a full game this would be more complex
     base_accuracy = 100
+    player = game_state["player"]
 
     # Penalties for major deviations
-    if "Egypt" in game_state["player"]["territories"]:
+    if "Egypt" in player["territories"]:
         base_accuracy -= 10  # Historical Egyptian campaign
 
-    if game_state["year"] > 1815 and game_state["player"]["troops"] > 10000:
+    if game_state["year"] > 1815 and player["troops"] > 10000:
         base_accuracy += 20  # Survived to end
 
     return clamp_value(base_accuracy, 0, 100)
@@ -167,7 +348,7 @@ def get_resource_status(troops: int, gold: int, morale: int) -> str:
         status_parts.append("🎉 High Morale")
 
     if not status_parts:
-        status_parts.append("✓ Stable")
+        return "✓ Stable"
 
     return " | ".join(status_parts)
 
@@ -180,24 +361,27 @@ def format_territory_list(territories: list) -> str:
     if len(territories) <= 3:
         return ", ".join(territories)
     else:
-        return f"{', '.join(territories[:3])} (+{len(territories) - 3} more)"
-
+        t = territories
+        return f"{t[0]}, {t[1]}, {t[2]} (+{len(t) - 3} more)"
 
-def create_backup_save(game_state: Dict[str, Any]) -> None:
-    """Create a backup save file."""
-    backup_filename = "napoleon_save_backup.json"
-    save_game(game_state, backup_filename)
 
+def create_backup_save(source: str = "napoleon_save.json") -> bool:
+    """Back up an existing save file by copying its bytes to BACKUP_FILENAME.
 
-def validate_game_state(game_state: Dict[str, Any]) -> bool:
-    """Validate that a game state has all required fields."""
-    required_fields = ["year", "season", "player", "current_event", "game_over"]
+    To back up the state being saved, use save_game(..., backup=True).
+    """
+    try:
+        with open(source, "rb") as f:
+            _write_atomic(BACKUP_FILENAME, f.read())
+        return True
+    except Exception as e:
+        print(f"Error writing backup save: {e}")
+        return False
 
-    for field in required_fields:
-        if field not in game_state:
-            return False
 
-    player_required = [
+_REQUIRED_FIELDS = frozenset({"year", "season", "player", "current_event", "game_over"})
+_PLAYER_REQUIRED_FIELDS = frozenset(
+    {
         "name",
         "troops",
         "gold",
@@ -205,29 +389,32 @@ def validate_game_state(game_state: Dict[str, Any]) -> bool:
         "territories",
         "allies",
         "enemies",
-    ]
-    for field in player_required:
-        if field not in game_state["player"]:
-            return False
+    }
+)
 
-    return True
+
+def validate_game_state(game_state: Dict[str, Any]) -> bool:
+    """Validate that a game state has all required fields."""
+    return _REQUIRED_FIELDS.issubset(game_state) and _PLAYER_REQUIRED_FIELDS.issubset(
+        game_state["player"]
+    )
 
 
 def get_game_statistics(game_state: Dict[str, Any]) -> Dict[str, Any]:
     """Calculate and return game statistics."""
     player = game_state["player"]
+    territories = player["territories"]
+    allies = player["allies"]
+    enemies = player["enemies"]
 
     return {
         "years_played": game_state["year"] - 1796,
-        "territories_controlled": len(player["territories"]),
-        "allies_gained": len(player["allies"]),
-        "enemies_remaining": len(player["enemies"]),
+        "territories_controlled": len(territories),
+        "allies_gained": len(allies),
+        "enemies_remaining": len(enemies),
         "peak_troops": player["troops"],  # Would need tracking
         "total_gold_earned": player["gold"],  # Would need tracking
         "battles_won": 0,  # Would need tracking
         "historical_accuracy": game_state.get("historical_accuracy", 100),
     }
 
-
-# Import random here to avoid circular imports
-import random